@@ -4,7 +4,10 @@ MCP Generator - Core orchestration.
 Main generator functions that coordinate introspection, rendering, and writing.
 """
 
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Any
 
 from .introspection import (
     get_api_metadata,
@@ -15,6 +18,23 @@ from .introspection import (
 from .models import ApiMetadata, ModuleSpec, SecurityConfig
 from .renderers import generate_server_module
 
+# Minimum number of API classes before process-pool generation pays for the
+# worker startup cost
+_PARALLEL_THRESHOLD = 4
+
+
+def _init_worker(generated_path: str) -> None:
+    """Make the generated client importable in pool workers (needed when the
+    start method is spawn; fork inherits sys.path anyway)."""
+    if generated_path not in sys.path:
+        sys.path.insert(0, generated_path)
+
+
+def _generate_one(item: tuple[str, type, list[dict[str, Any]]]) -> ModuleSpec:
+    """Worker entry: generate one server module (must be picklable)."""
+    api_var_name, api_class, resource_endpoints = item
+    return generate_server_module(api_var_name, api_class, resource_endpoints)
+
 
 def generate_modular_servers(
     base_dir: Path | None = None, enable_resources: bool = False
@@ -39,21 +59,39 @@ def generate_modular_servers(
     if enable_resources:
         resources_by_tag = get_resource_endpoints(base_dir)
 
-    servers: dict[str, ModuleSpec] = {}
-    total_tools = 0
-
-    # Generate a server module for each API class. Key the resulting dict by
-    # ModuleSpec.module_name (stable identifier) rather than filename to avoid
-    # brittle filename-based lookups downstream.
-    for api_var_name in sorted(api_modules.keys()):
-        api_class = api_modules[api_var_name]
+    # Build one work item per API class, sorted for deterministic output.
+    # Map api_var_name (e.g., 'pet_api') to tag (e.g., 'pet') to find
+    # matching resource endpoints.
+    items = [
+        (
+            api_var_name,
+            api_modules[api_var_name],
+            resources_by_tag.get(api_var_name.replace("_api", ""), []),
+        )
+        for api_var_name in sorted(api_modules.keys())
+    ]
 
-        # Find matching resource endpoints for this API by tag
-        # Map api_var_name (e.g., 'pet_api') to tag (e.g., 'pet')
-        tag_name = api_var_name.replace("_api", "")
-        resource_endpoints = resources_by_tag.get(tag_name, [])
+    # Module generation is CPU-bound pure Python (introspection + string
+    # building) and independent per API class, so fan out across processes
+    # for large specs. Fall back to the sequential path if the pool fails
+    # (e.g., API classes that don't pickle by reference).
+    module_specs: list[ModuleSpec]
+    if len(items) >= _PARALLEL_THRESHOLD:
+        try:
+            with ProcessPoolExecutor(
+                initializer=_init_worker, initargs=(str(base_dir / "generated_openapi"),)
+            ) as executor:
+                module_specs = list(executor.map(_generate_one, items))
+        except Exception:
+            module_specs = [_generate_one(item) for item in items]
+    else:
+        module_specs = [_generate_one(item) for item in items]
 
-        module_spec = generate_server_module(api_var_name, api_class, resource_endpoints)
+    # Key the resulting dict by ModuleSpec.module_name (stable identifier)
+    # rather than filename to avoid brittle filename-based lookups downstream.
+    servers: dict[str, ModuleSpec] = {}
+    total_tools = 0
+    for module_spec in module_specs:
         servers[module_spec.module_name] = module_spec
         total_tools += module_spec.tool_count
 
@@ -228,12 +228,20 @@ def get_security_config(base_dir: Path | None = None) -> SecurityConfig:
 
     config = SecurityConfig(schemes=security_schemes, global_security=spec.get("security", []))
 
-    # Extract OAuth2 configuration if present
+    # Extract OAuth2 configuration and scheme-type flags in one pass
+    oauth_flows: list[str] = []
     for scheme_name, scheme_def in security_schemes.items():
         scheme_type = scheme_def.get("type", "").lower()
 
+        if scheme_type == "apikey":
+            config.has_api_key = True
+        elif scheme_type == "http" and scheme_def.get("scheme") == "basic":
+            config.has_basic_auth = True
+
         if scheme_type == "oauth2":
+            config.has_oauth2 = True
             flows = scheme_def.get("flows", {})
+            oauth_flows.extend(flows.keys())
             oauth_config = OAuthConfig(scheme_name=scheme_name)
 
             # Extract all OAuth flows
@@ -254,8 +262,11 @@ def get_security_config(base_dir: Path | None = None) -> SecurityConfig:
 
         elif scheme_type == "http" and scheme_def.get("scheme") == "bearer":
             # Bearer token (JWT)
+            config.has_bearer_auth = True
             config.bearer_format = scheme_def.get("bearerFormat", "JWT")
 
+    config.oauth_flows = tuple(oauth_flows)
+
     # Extract default scopes from global security requirements
     default_scopes = set()
     for sec_req in config.global_security:
@@ -64,6 +64,13 @@ class SecurityConfig:
     jwks_uri: str | None = None
     issuer: str | None = None
     audience: str | None = None
+    # Scheme-type flags derived once while the spec is parsed, so template
+    # generators do not rescan the scheme dicts per invocation.
+    has_oauth2: bool = False
+    has_api_key: bool = False
+    has_basic_auth: bool = False
+    has_bearer_auth: bool = False
+    oauth_flows: tuple[str, ...] = ()
 
     def get_jwks_uri(self, backend_url: str) -> str:
         """Get JWKS URI with fallback."""
@@ -118,6 +125,14 @@ class ToolSpec:
     parameters: list[ParameterInfo]
     docstring: str
     has_pydantic_params: bool = False
+    # Pre-rendered fragments (computed once per parameter in _build_tool_spec
+    # so rendering does not re-iterate the parameter list)
+    func_params_str: str = ""
+    call_args_str: str = ""
+    pydantic_conversion: str = ""
+    # Pydantic model class names this tool needs; imports are hoisted into
+    # the generated module header (deduped across tools)
+    pydantic_model_names: list[str] = field(default_factory=list)
 
 
 @dataclass
@@ -132,3 +147,161 @@ class ResourceSpec:
     query_params: list[ParameterInfo]
     description: str
     mime_type: str = "application/json"
+
+
+_HTTP_METHODS = frozenset({"get", "post", "put", "patch", "delete"})
+
+# Maps (type, scheme) of a security scheme to the feature flag it sets.
+# Swagger 2.0 uses types oauth2/apiKey/basic; OpenAPI 3.x folds basic and
+# bearer under type "http" with a "scheme" field.
+_SECURITY_SCHEME_FLAGS = {
+    ("oauth2", None): "oauth2",
+    ("apiKey", None): "api_key",
+    ("basic", None): "basic",
+    ("http", "bearer"): "bearer",
+    ("http", "basic"): "basic",
+}
+
+
+@dataclass
+class SpecFeatures:
+    """Version and feature flags projected out of an OpenAPI spec.
+
+    Built with one walk of the spec via from_spec(); template generators
+    read these precomputed fields instead of re-scanning the raw dict.
+    """
+
+    openapi_version: str
+    is_swagger_2: bool
+    is_openapi_30: bool
+    is_openapi_31: bool
+    has_oauth2: bool
+    has_api_key: bool
+    has_basic_auth: bool
+    has_bearer_auth: bool
+    oauth_flows: tuple[str, ...]
+    has_file_upload: bool
+    has_form_data: bool
+    has_examples: bool
+    response_content_types: frozenset[str]
+    param_locations: frozenset[str]
+    has_webhooks: bool
+
+    @classmethod
+    def from_spec(
+        cls, openapi_spec: dict, security_config: SecurityConfig | None = None
+    ) -> "SpecFeatures":
+        """Scan an OpenAPI spec dict once and project its feature flags.
+
+        When a SecurityConfig parsed from the same spec is supplied, its
+        precomputed scheme flags are reused instead of rescanning.
+        """
+        openapi_version = openapi_spec.get("openapi", openapi_spec.get("swagger", "unknown"))
+        # Classify the version with one split instead of three startswith scans.
+        major, dot, minor = openapi_version.partition(".")
+        is_swagger_2 = major == "2" and bool(dot)
+        is_openapi_30 = major == "3" and minor.startswith("0")
+        is_openapi_31 = major == "3" and minor.startswith("1")
+
+        # Security schemes: one (type, scheme) table lookup per entry; the
+        # table covers both the Swagger 2.0 and OpenAPI 3.x dialects.
+        flags = {"oauth2": False, "api_key": False, "basic": False, "bearer": False}
+        oauth_flows: list[str] = []
+        if security_config is not None and security_config.schemes:
+            flags = {
+                "oauth2": security_config.has_oauth2,
+                "api_key": security_config.has_api_key,
+                "basic": security_config.has_basic_auth,
+                "bearer": security_config.has_bearer_auth,
+            }
+            oauth_flows = list(security_config.oauth_flows)
+        else:
+            if is_swagger_2:
+                security_schemes = openapi_spec.get("securityDefinitions", {})
+            else:
+                security_schemes = openapi_spec.get("components", {}).get("securitySchemes", {})
+            for _scheme_name, scheme in security_schemes.items():
+                scheme_type = scheme.get("type")
+                flag = _SECURITY_SCHEME_FLAGS.get(
+                    (scheme_type, scheme.get("scheme"))
+                ) or _SECURITY_SCHEME_FLAGS.get((scheme_type, None))
+                if flag:
+                    flags[flag] = True
+                if scheme_type == "oauth2":
+                    if is_swagger_2:
+                        oauth_flows.append(scheme.get("flow", "unknown"))
+                    else:
+                        oauth_flows.extend(scheme.get("flows", {}).keys())
+
+        # Single pass over paths: request content types (file uploads, form
+        # data), response content types, and response examples are all
+        # collected together, with the version decision hoisted out.
+        has_file_upload = False
+        has_form_data = False
+        has_examples = False
+        raw_content_types: list[str] = []
+        param_locations: set[str] = set()
+        paths = openapi_spec.get("paths") or {}
+        if is_swagger_2:
+            for path_item in paths.values():
+                for param in path_item.get("parameters", []):
+                    if "in" in param:
+                        param_locations.add(param["in"])
+                for method in path_item:
+                    if method not in _HTTP_METHODS and method.lower() not in _HTTP_METHODS:
+                        continue
+                    operation = path_item[method]
+                    for param in operation.get("parameters", []):
+                        if "in" in param:
+                            param_locations.add(param["in"])
+                    if not (has_file_upload and has_form_data):
+                        consumes = operation.get("consumes", [])
+                        if "multipart/form-data" in consumes:
+                            has_file_upload = True
+                        if "application/x-www-form-urlencoded" in consumes:
+                            has_form_data = True
+                    raw_content_types.extend(operation.get("produces", []))
+        else:
+            for path_item in paths.values():
+                for param in path_item.get("parameters", []):
+                    if "in" in param:
+                        param_locations.add(param["in"])
+                for method in path_item:
+                    if method not in _HTTP_METHODS and method.lower() not in _HTTP_METHODS:
+                        continue
+                    operation = path_item[method]
+                    for param in operation.get("parameters", []):
+                        if "in" in param:
+                            param_locations.add(param["in"])
+                    if not (has_file_upload and has_form_data):
+                        body_content = operation.get("requestBody", {}).get("content", {})
+                        if "multipart/form-data" in body_content:
+                            has_file_upload = True
+                        if "application/x-www-form-urlencoded" in body_content:
+                            has_form_data = True
+                    for _status, response in operation.get("responses", {}).items():
+                        content = response.get("content", {})
+                        raw_content_types.extend(content)
+                        if not has_examples:
+                            for media_obj in content.values():
+                                if "examples" in media_obj or "example" in media_obj:
+                                    has_examples = True
+                                    break
+
+        return cls(
+            openapi_version=openapi_version,
+            is_swagger_2=is_swagger_2,
+            is_openapi_30=is_openapi_30,
+            is_openapi_31=is_openapi_31,
+            has_oauth2=flags["oauth2"],
+            has_api_key=flags["api_key"],
+            has_basic_auth=flags["basic"],
+            has_bearer_auth=flags["bearer"],
+            oauth_flows=tuple(oauth_flows),
+            has_file_upload=has_file_upload,
+            has_form_data=has_form_data,
+            has_examples=has_examples,
+            response_content_types=frozenset(raw_content_types),
+            param_locations=frozenset(param_locations),
+            has_webhooks="webhooks" in openapi_spec,
+        )
@@ -5,44 +5,102 @@ Orchestrates template rendering and code generation for MCP servers,
 middleware, and OAuth providers.
 """
 
+import ast
+import functools
 import inspect
+import json
+import os
+import re
 from pathlib import Path
 from typing import Any, get_type_hints
 
 from .models import ModuleSpec, ParameterInfo, ResourceSpec, ToolSpec
 from .utils import camel_to_snake, format_parameter_description, sanitize_name
 
+# Sentinel for "no default value" (avoids attribute lookups in hot loops)
+_EMPTY = inspect.Parameter.empty
+
+# Method name substrings that never become tools (duplicate client variants)
+_SKIP_SUBSTR = ("with_http_info", "without_preload")
+
+# Precomputed helpers for pyproject description cleaning
+_WS_RE = re.compile(r"\s+")
+_QUOTE_TABLE = str.maketrans({'"': "'"})
+
+# Template locations resolved once at import (avoids rebuilding Path objects
+# on every render call)
+_TEMPLATES_DIR = Path(__file__).resolve().parent / "templates"
+_PYPROJECT_TEMPLATE_PATH = _TEMPLATES_DIR / "pyproject_template.toml"
+
+# Runtime dependencies for generated servers. Only two dependency sets are
+# ever emitted (with/without storage encryption), so render both TOML arrays
+# once at import time.
+_DEPS_BASE = [
+    "fastmcp>=2.2.0,<3.0.0",
+    "httpx>=0.23.0",
+    "pydantic>=2.0.0,<3.0.0",
+    "python-dateutil>=2.8.2",
+    "urllib3>=2.0.0,<3.0.0",
+    "typing-extensions>=4.7.1",
+    "python-jose[cryptography]>=3.3.0,<4.0.0",
+    "uvicorn>=0.20.0",
+    "anyio>=3.6.0",
+    "annotated-types>=0.4.0",
+]
+_DEPS_WITH_STORAGE = [*_DEPS_BASE, "cryptography>=42.0.0"]
+_DEPS_TOML_BASE = "\n    ".join(f'"{dep}",' for dep in _DEPS_BASE)
+_DEPS_TOML_STORAGE = "\n    ".join(f'"{dep}",' for dep in _DEPS_WITH_STORAGE)
+
+
+@functools.cache
+def _cached_sig_hints(method) -> tuple[inspect.Signature, dict[str, Any]]:
+    """Memoized signature + type hints for a method.
+
+    get_type_hints resolves forward references via eval, so caching per
+    function object keeps introspection a one-time cost per distinct method.
+    """
+    try:
+        hints = get_type_hints(method)
+    except Exception:
+        hints = {}
+    return inspect.signature(method), hints
 
-def render_pyproject_template(
-    api_metadata, security_config, server_name, total_tools, enable_storage=False
-):
-    """Render the pyproject.toml template with provided values."""
-    template_path = Path(__file__).parent / "templates" / "pyproject_template.toml"
-    with open(template_path, encoding="utf-8") as f:
+
+@functools.cache
+def _load_pyproject_template() -> str:
+    """Load and sanity-check the pyproject template once per process.
+
+    Strips any non-comment junk before the first TOML section header
+    (defensive, in case the template file is edited), so render calls can
+    use the cleaned text directly instead of re-filtering per call.
+    """
+    with open(_PYPROJECT_TEMPLATE_PATH, encoding="utf-8") as f:
         template = f.read()
-    # Remove any non-comment, non-section-header lines at the top (defensive, in case template is changed)
 
     lines = template.splitlines()
     cleaned_lines = []
     found_section = False
     for line in lines:
-        if line.strip() == "" or line.strip().startswith("#"):
-            cleaned_lines.append(line)
-        elif line.strip().startswith("["):
+        stripped = line.strip()
+        if stripped == "" or stripped.startswith("#") or stripped.startswith("["):
             cleaned_lines.append(line)
-            found_section = True
-        elif not found_section:
-            # skip accidental junk at the very top (before first section)
-            continue
-        else:
+            found_section = found_section or stripped.startswith("[")
+        elif found_section:
             cleaned_lines.append(line)
-    template = "\n".join(cleaned_lines)
+        # else: skip accidental junk at the very top (before first section)
+    return "\n".join(cleaned_lines)
+
+
+def render_pyproject_template(
+    api_metadata, security_config, server_name, total_tools, enable_storage=False
+):
+    """Render the pyproject.toml template with provided values."""
+    template = _load_pyproject_template()
 
     # Sanitize version to be PEP 440 compliant
     raw_version = str(getattr(api_metadata, "version", "0.1.0"))
     # Replace invalid dots in local version with + (e.g., 1.0.0.abc123 -> 1.0.0+abc123)
     # PEP 440: local version must use + separator, not .
-    import re
 
     # Match pattern: major.minor.patch followed by optional pre-release, then .something
     # Convert the last dot before local version identifier to +
@@ -59,23 +117,9 @@ def render_pyproject_template(
             raw_version,
         )
 
-    # Build dependencies list
-    dependencies = [
-        "fastmcp>=2.2.0,<3.0.0",
-        "httpx>=0.23.0",
-        "pydantic>=2.0.0,<3.0.0",
-        "python-dateutil>=2.8.2",
-        "urllib3>=2.0.0,<3.0.0",
-        "typing-extensions>=4.7.1",
-        "python-jose[cryptography]>=3.3.0,<4.0.0",
-        "uvicorn>=0.20.0",
-        "anyio>=3.6.0",
-        "annotated-types>=0.4.0",
-    ]
-
-    # Add cryptography for storage encryption if storage is enabled
-    if enable_storage:
-        dependencies.append("cryptography>=42.0.0")
+    # Pick the precomputed dependency array (cryptography is added for
+    # storage encryption)
+    dependencies_toml = _DEPS_TOML_STORAGE if enable_storage else _DEPS_TOML_BASE
 
     packages = ["servers"]
     if security_config.has_authentication():
@@ -83,16 +127,12 @@ def render_pyproject_template(
     # Render template
     # Clean description: single-line, escape quotes, remove newlines/markdown
     raw_description = getattr(api_metadata, "description", "MCP Server")
-    # Remove newlines and excessive whitespace
-    clean_description = " ".join(raw_description.split())
-    # Escape double quotes
-    clean_description = clean_description.replace('"', "'")
+    # Collapse whitespace and replace double quotes in minimal string passes
+    clean_description = _WS_RE.sub(" ", raw_description.strip()).translate(_QUOTE_TABLE)
     # Truncate if too long (TOML recommends short descriptions)
     if len(clean_description) > 200:
         clean_description = clean_description[:197] + "..."
 
-    # Render dependencies as TOML array: each line is a quoted string ending with a comma
-    dependencies_toml = "\n    ".join([f'"{dep}",' for dep in dependencies])
     return (
         template.replace("{{project_name}}", server_name.replace("_", "-").replace(".", "-"))
         .replace("{{version}}", sanitized_version)
@@ -106,26 +146,33 @@ def render_pyproject_template(
 
 
 def render_fastmcp_template(api_metadata, security_config, modules, total_tools, server_name):
-    """Render the fastmcp.json template with provided values."""
-    template_path = Path(__file__).parent / "templates" / "fastmcp_template.json"
-    with open(template_path, encoding="utf-8") as f:
-        template = f.read()
-    # Simple replacements for demonstration; expand as needed
-    return (
-        template.replace("{{composition_strategy}}", "mount")
-        .replace("{{resource_prefix_format}}", "path")
-        .replace("{{validate_tokens}}", "false")
-    )
+    """Render the fastmcp.json config with provided values.
+
+    Built as a dict and serialized directly (no disk read or placeholder
+    substitution); templates/fastmcp_template.json remains as a reference
+    for the schema. This also emits validate_tokens as a real boolean
+    instead of the string "false" the old substitution produced.
+    """
+    config = {
+        "composition": {
+            "strategy": "mount",
+            "resource_prefix_format": "path",
+        },
+        "middleware": {
+            "config": {
+                "authentication": {
+                    "validate_tokens": False,
+                }
+            }
+        },
+    }
+    return json.dumps(config, indent=2)
 
 
 def generate_tool_for_method(api_var_name: str, method_name: str, method) -> str:
     """Generate MCP tool function for a single API method."""
     # Skip internal methods
-    if (
-        method_name.startswith("_")
-        or "with_http_info" in method_name
-        or "without_preload" in method_name
-    ):
+    if method_name.startswith("_") or any(s in method_name for s in _SKIP_SUBSTR):
         return ""
 
     tool_spec = _build_tool_spec(api_var_name, method_name, method)
@@ -139,15 +186,17 @@ def _build_tool_spec(api_var_name: str, method_name: str, method) -> ToolSpec |
     """Build tool specification from method introspection."""
     tool_name = sanitize_name(method_name)
 
-    # Get method signature and type hints
-    sig = inspect.signature(method)
-    try:
-        hints = get_type_hints(method)
-    except Exception:
-        hints = {}
+    # Get method signature and type hints (memoized per method object)
+    sig, hints = _cached_sig_hints(method)
 
     parameters = []
 
+    # Rendered fragments accumulated in the same pass over the parameters
+    func_params = ["ctx: Context"]
+    call_args = []
+    conversion_parts = []
+    model_names = []
+
     for param_name, param in sig.parameters.items():
         if param_name in ["self", "kwargs"]:
             continue
@@ -166,7 +215,7 @@ def _build_tool_spec(api_var_name: str, method_name: str, method) -> ToolSpec |
         param_desc, example_json = format_parameter_description(param_name, param_type, method)
 
         # Determine if required (no default value)
-        required = param.default == inspect.Parameter.empty
+        required = param.default is _EMPTY
 
         param_info = ParameterInfo(
             name=param_name,
@@ -179,6 +228,25 @@ def _build_tool_spec(api_var_name: str, method_name: str, method) -> ToolSpec |
         )
         parameters.append(param_info)
 
+        # Function signature fragment
+        if required:
+            func_params.append(f"{param_name}: str")
+        else:
+            func_params.append(f"{param_name}: str | None = None")
+
+        # Call argument + Pydantic conversion fragments
+        if is_pydantic:
+            model_class_name = param_type.__name__
+            call_args.append(f"{param_name}={param_name}_obj")
+            model_names.append(model_class_name)
+            conversion_parts.append(f"""
+        # Convert JSON string to Pydantic model
+        {param_name}_data = json.loads({param_name}) if isinstance({param_name}, str) else {param_name}
+        {param_name}_obj = {model_class_name}(**{param_name}_data)
+""")
+        else:
+            call_args.append(f"{param_name}={param_name}")
+
     # Get docstring
     doc = inspect.getdoc(method) or f"Call {method_name}"
     doc_lines = doc.split("\n")
@@ -187,15 +255,17 @@ def _build_tool_spec(api_var_name: str, method_name: str, method) -> ToolSpec |
     # Build enhanced docstring
     enhanced_doc = _build_enhanced_docstring(description, parameters, api_var_name, method_name)
 
-    has_pydantic = any(p.is_pydantic for p in parameters)
-
     return ToolSpec(
         tool_name=tool_name,
         method_name=method_name,
         api_var_name=api_var_name,
         parameters=parameters,
         docstring=enhanced_doc,
-        has_pydantic_params=has_pydantic,
+        has_pydantic_params=bool(model_names),
+        func_params_str=", ".join(func_params),
+        call_args_str=", ".join(call_args),
+        pydantic_conversion="".join(conversion_parts),
+        pydantic_model_names=model_names,
     )
 
 
@@ -227,47 +297,14 @@ def _build_enhanced_docstring(
 
 
 def _render_tool(spec: ToolSpec) -> str:
-    """Render tool function code from specification."""
-    # Build function signature
-    func_params = ["ctx: Context"]
-    for param in spec.parameters:
-        if param.required:
-            func_params.append(f"{param.name}: str")
-        else:
-            func_params.append(f"{param.name}: str | None = None")
-
-    # Build parameter conversion code for Pydantic models
-    param_conversion_code = ""
-    pydantic_params = [p for p in spec.parameters if p.is_pydantic]
-
-    if pydantic_params:
-        for param in pydantic_params:
-            model_class_name = param.pydantic_class.__name__
-            param_conversion_code += f"""
-        # Convert JSON string to Pydantic model
-        import json
-        {param.name}_data = json.loads({param.name}) if isinstance({param.name}, str) else {param.name}
-        {param.name}_obj = {model_class_name}(**{param.name}_data)
-"""
-
-    # Build method call arguments - use converted objects for Pydantic params
-    call_args_list = []
-    for param in spec.parameters:
-        if param.is_pydantic:
-            call_args_list.append(f"{param.name}={param.name}_obj")
-        else:
-            call_args_list.append(f"{param.name}={param.name}")
-    call_args = ", ".join(call_args_list)
-
-    # Import Pydantic model classes
-    model_imports = ""
-    if pydantic_params:
-        model_names = [p.pydantic_class.__name__ for p in pydantic_params]
-        model_imports = f"\n        from generated_openapi.openapi_client.models import {', '.join(set(model_names))}"
+    """Render tool function code from specification.
 
+    All per-parameter fragments (signature, call args, Pydantic conversion,
+    model imports) are precomputed in _build_tool_spec.
+    """
     code = f'''
 @mcp.tool
-async def {spec.tool_name}({", ".join(func_params)}) -> dict[str, Any]:
+async def {spec.tool_name}({spec.func_params_str}) -> dict[str, Any]:
     """
     {spec.docstring}
     """
@@ -281,11 +318,11 @@ async def {spec.tool_name}({", ".join(func_params)}) -> dict[str, Any]:
             raise Exception("API client not available. Authentication middleware may not be configured.")
 
         apis = _get_api_instances(openapi_client)
-        {spec.api_var_name} = apis['{spec.api_var_name}']{model_imports}{param_conversion_code}
+        {spec.api_var_name} = apis['{spec.api_var_name}']{spec.pydantic_conversion}
 
         # Log API call
         await ctx.debug(f"Calling API: {spec.method_name}")
-        response = {spec.api_var_name}.{spec.method_name}({call_args})
+        response = {spec.api_var_name}.{spec.method_name}({spec.call_args_str})
 
         # Convert response to dict - handle various response types
         if response is None:
@@ -525,8 +562,9 @@ def generate_server_module(
     api_class_name = api_class.__name__
     module_name = api_var_name.replace("_api", "").title().replace("_", "")
 
-    # Header
-    code = f'''"""
+    # Header (accumulate code fragments in a list and join once at the end;
+    # repeated `code += ...` is quadratic on modules with many tools)
+    header = f'''"""
 {module_name} MCP Server Module.
 
 Auto-generated from {api_class_name}.
@@ -557,18 +595,21 @@ logger = logging.getLogger(__name__)
 mcp = FastMCP("{module_name}")
 
 
+# Status code -> user-friendly error message (table lookup beats branching)
+_ERROR_MESSAGES = {{
+    401: "Authentication required. User token invalid or missing.",
+    403: "Permission denied. Your role does not allow this action.",
+    404: "Resource not found.",
+    500: "Backend server error.",
+}}
+
+
 def _format_api_error(e: ApiException) -> str:
     """Format API exception into user-friendly error message."""
-    if e.status == 401:
-        return "Authentication required. User token invalid or missing."
-    elif e.status == 403:
-        return "Permission denied. Your role does not allow this action."
-    elif e.status == 404:
-        return "Resource not found."
-    elif e.status == 500:
-        return "Backend server error."
-    else:
-        return f"API error (status {{e.status}}): {{e.reason}}"
+    message = _ERROR_MESSAGES.get(e.status)
+    if message is None:
+        message = f"API error (status {{e.status}}): {{e.reason}}"
+    return message
 
 
 def _get_api_instances(openapi_client: ApiClient) -> dict:
@@ -583,30 +624,50 @@ def _get_api_instances(openapi_client: ApiClient) -> dict:
 
 '''
 
-    # Generate tools for this API
-    tool_count = 0
-    for method_name in dir(api_class):
-        if method_name.startswith("_"):
-            continue
+    parts = [header]
 
-        method = getattr(api_class, method_name)
-        if not callable(method):
-            continue
+    # Collect candidate methods from the class __dict__ (walking the MRO for
+    # inherited methods) instead of dir() + getattr: this skips MRO flattening
+    # and per-name descriptor invocation. Sort for deterministic output.
+    methods: dict[str, Any] = {}
+    for klass in api_class.__mro__[:-1]:  # skip object
+        for method_name, method in vars(klass).items():
+            if method_name in methods or method_name.startswith("_"):
+                continue
+            if any(s in method_name for s in _SKIP_SUBSTR):
+                continue
+            if callable(method):
+                methods[method_name] = method
 
-        tool_code = generate_tool_for_method(api_var_name, method_name, method)
-        if tool_code:
-            code += tool_code
+    # Generate tools for this API
+    tool_count = 0
+    model_names: set[str] = set()
+    for method_name in sorted(methods):
+        tool_spec = _build_tool_spec(api_var_name, method_name, methods[method_name])
+        if tool_spec:
+            parts.append(_render_tool(tool_spec))
             tool_count += 1
+            model_names.update(tool_spec.pydantic_model_names)
+
+    # Hoist Pydantic conversion imports into the module header: one json
+    # import and one deduped models import instead of per-tool-call imports
+    if model_names:
+        parts.insert(
+            1,
+            "# Imports for Pydantic parameter conversion (hoisted from tool bodies)\n"
+            "import json\n"
+            f"from generated_openapi.openapi_client.models import {', '.join(sorted(model_names))}\n",
+        )
 
     # Generate resource templates if requested
     resource_count = 0
     if resource_endpoints:
-        code += """
+        parts.append("""
 
 # Generated resource templates
 # ============================================================================
 
-"""
+""")
         for endpoint in resource_endpoints:
             operation_id = endpoint["operation_id"]
             # Convert camelCase operation_id to snake_case method name
@@ -620,17 +681,28 @@ def _get_api_instances(openapi_client: ApiClient) -> dict:
 
             if resource_spec:
                 resource_code = render_resource(resource_spec)
-                code += resource_code
+                parts.append(resource_code)
                 resource_count += 1
 
     # Footer
-    code += f"""
+    parts.append(f"""
 
 # Generated {tool_count} tools and {resource_count} resources for {api_class_name}
-"""
+""")
+
+    code = "".join(parts)
 
     filename = f"{api_var_name.replace('_api', '')}_server.py"
 
+    # Dev-mode guard: syntax-check the rendered module at generation time so
+    # template bugs surface here instead of at import time of the generated
+    # server (set MCP_GEN_VALIDATE=1 to enable)
+    if os.environ.get("MCP_GEN_VALIDATE"):
+        try:
+            ast.parse(code, filename=filename)
+        except SyntaxError as e:
+            raise ValueError(f"Generated module {filename} is not valid Python: {e}") from e
+
     return ModuleSpec(
         filename=filename,
         api_var_name=api_var_name,
@@ -7,6 +7,7 @@ Use 'register-mcp' to add servers to the registry.
 """
 
 import argparse
+import functools
 import json
 import os
 import sys
@@ -34,18 +35,26 @@ def get_registry_path() -> Path:
     return Path.home() / ".mcp-generator" / "servers.json"
 
 
+@functools.lru_cache(maxsize=8)
+def _load_registry_cached(path_str: str, mtime: float) -> dict:
+    """Parse the registry file, keyed on (path, mtime) so edits invalidate."""
+    try:
+        with open(path_str, encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
 def load_local_registry() -> dict:
     """Load the local MCP servers registry."""
     registry_path = get_registry_path()
-    if not registry_path.exists():
-        return {}
-
     try:
-        with open(registry_path, encoding="utf-8") as f:
-            return json.load(f)
-    except Exception:
+        mtime = registry_path.stat().st_mtime
+    except OSError:
         return {}
 
+    return _load_registry_cached(str(registry_path), mtime)
+
 
 def list_servers():
     """List all registered MCP servers from local registry."""
@@ -136,13 +145,23 @@ def main():
         server_path = Path(info["path"])
         entry_point = info["entry_point"]  # e.g. "module_name:main"
 
-        # Add server path to sys.path
-        if str(server_path) not in sys.path:
-            sys.path.insert(0, str(server_path))
-
-        # Import and get the main function
+        # Import and get the main function. Load the module directly from its
+        # known file location instead of inserting server_path into sys.path
+        # and walking every finder via __import__.
         module_name, func_name = entry_point.split(":")
-        module = __import__(module_name)
+        module_file = server_path / f"{module_name}.py"
+        if module_file.is_file():
+            from importlib import util
+
+            spec = util.spec_from_file_location(module_name, module_file)
+            module = util.module_from_spec(spec)
+            sys.modules[module_name] = module
+            spec.loader.exec_module(module)
+        else:
+            # Entry point is a package directory - fall back to a normal import
+            if str(server_path) not in sys.path:
+                sys.path.insert(0, str(server_path))
+            module = __import__(module_name)
         server_main = getattr(module, func_name)
 
         # Set up sys.argv for the server's argument parser
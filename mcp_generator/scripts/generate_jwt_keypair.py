@@ -5,26 +5,47 @@ import json
 import os
 from pathlib import Path
 
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.primitives.asymmetric import rsa
 
+def _int_to_base64url(num: int) -> str:
+    """Encode an RSA public number as an unpadded base64url string (RFC 7518)."""
+    num_bytes = num.to_bytes((num.bit_length() + 7) // 8, byteorder="big")
+    return base64.urlsafe_b64encode(num_bytes).decode("utf-8").rstrip("=")
 
-def generate_keypair(output_dir: Path, kid: str = "ai-assistant-key-1") -> tuple[str, str, dict]:
+
+def generate_keypair(
+    output_dir: Path, kid: str = "ai-assistant-key-1", force: bool = False
+) -> tuple[str, str, dict]:
     """
     Generate RSA key pair for JWT signing.
 
     Args:
         output_dir: Directory to save keys
         kid: Key ID for JWKS
+        force: Regenerate even if a keypair already exists in output_dir
 
     Returns:
         Tuple of (private_key_path, public_key_path, jwks_dict)
     """
-    # Generate private key
-    private_key = rsa.generate_private_key(
-        public_exponent=65537, key_size=2048, backend=default_backend()
-    )
+    # Deferred imports: keep OpenSSL bindings off the module import path so
+    # tooling can introspect this module without paying the cold-start cost
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    private_key_path = output_dir / "ai_assistant_private.pem"
+    public_key_path = output_dir / "ai_assistant_public.pem"
+    jwks_path = output_dir / "ai_assistant_jwks.json"
+
+    # Reuse an existing keypair unless asked to regenerate - RSA key
+    # generation costs 50-200ms per call, which adds up in test harnesses
+    if not force and private_key_path.exists() and public_key_path.exists() and jwks_path.exists():
+        with open(jwks_path, encoding="utf-8") as f:
+            jwks = json.load(f)
+        print(f"♻️  Reusing existing keypair in: {output_dir}")
+        return str(private_key_path), str(public_key_path), jwks
+
+    # Generate private key (the backend kwarg has been a no-op since
+    # cryptography 3.1, so it is omitted)
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
 
     # Serialize private key to PEM format
     private_pem = private_key.private_bytes(
@@ -42,21 +63,13 @@ def generate_keypair(output_dir: Path, kid: str = "ai-assistant-key-1") -> tuple
     # Generate JWKS (JSON Web Key Set) for Keycloak
     public_numbers = public_key.public_numbers()
 
-    # Convert to base64url encoding (without padding)
-    def int_to_base64url(num: int) -> str:
-        """Convert integer to base64url string."""
-        # Get bytes with big-endian byte order
-        num_bytes = num.to_bytes((num.bit_length() + 7) // 8, byteorder="big")
-        # Encode to base64url (no padding)
-        return base64.urlsafe_b64encode(num_bytes).decode("utf-8").rstrip("=")
-
     jwk = {
         "kty": "RSA",
         "use": "sig",
         "alg": "RS384",
         "kid": kid,
-        "n": int_to_base64url(public_numbers.n),
-        "e": int_to_base64url(public_numbers.e),
+        "n": _int_to_base64url(public_numbers.n),
+        "e": _int_to_base64url(public_numbers.e),
     }
 
     jwks = {"keys": [jwk]}
@@ -64,21 +77,13 @@ def generate_keypair(output_dir: Path, kid: str = "ai-assistant-key-1") -> tuple
     # Create output directory if it doesn't exist
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Write private key
-    private_key_path = output_dir / "ai_assistant_private.pem"
-    with open(private_key_path, "wb") as f:
-        f.write(private_pem)
+    # Write each file in a single buffered emission (no per-file
+    # open/write/close boilerplate)
+    private_key_path.write_bytes(private_pem)
     os.chmod(private_key_path, 0o600)  # Secure permissions
 
-    # Write public key
-    public_key_path = output_dir / "ai_assistant_public.pem"
-    with open(public_key_path, "wb") as f:
-        f.write(public_pem)
-
-    # Write JWKS JSON
-    jwks_path = output_dir / "ai_assistant_jwks.json"
-    with open(jwks_path, "w") as f:
-        json.dump(jwks, f, indent=2)
+    public_key_path.write_bytes(public_pem)
+    jwks_path.write_text(json.dumps(jwks, indent=2), encoding="utf-8")
 
     print(f"✅ Private key saved to: {private_key_path}")
     print(f"✅ Public key saved to: {public_key_path}")
@@ -55,18 +55,37 @@ Usage:
         return result
 """
 
+import asyncio
 import hashlib
 import json
 import logging
-from datetime import datetime, timedelta, timezone
+import time
 from functools import wraps
 from typing import Any, Callable, Optional, ParamSpec, TypeVar
 
 logger = logging.getLogger(__name__)
 
+# Prefer orjson (C-accelerated) for cache entry serialization; fall back to
+# stdlib json when it is not installed. _json_dumps returns bytes so entries
+# flow to the backend's bytes API without an encode/decode round-trip.
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _json_loads = json.loads
+
 P = ParamSpec('P')
 R = TypeVar('R')
 
+# Wall-clock indirection for TTL checks; tests monkeypatch this to advance
+# time synthetically instead of sleeping
+_now = time.time
+
 
 class CacheMiddleware:
     """
@@ -89,8 +108,67 @@ class CacheMiddleware:
         """
         self.storage = storage
         self.default_ttl = default_ttl
+        # Bounded in-memory cache in front of the storage backend: hot keys
+        # skip disk/crypto entirely. Maps cache_key -> (expires_at, seq,
+        # data); dict get/setitem/pop are atomic under the GIL so reads are
+        # lock-free, and the monotonically advancing seq substitutes for
+        # OrderedDict recency ordering. Only eviction takes the lock.
+        self._l1: dict[str, tuple[float, int, Any]] = {}
+        self._l1_seq = 0
+        self._l1_max = 1024
+        self._l1_lock = asyncio.Lock()
+        # Index of live cache keys so clear_all only touches cache entries
+        # (storage.clear() would wipe unrelated data like OAuth tokens).
+        # Persisted under _INDEX_KEY so it survives restarts.
+        self._keys: set[str] = set()
+        self._index_loaded = False
+        # Circuit breaker: after _BREAKER_THRESHOLD consecutive backend
+        # failures the cache steps aside for a backoff window, so an outage
+        # costs one monotonic compare per call instead of hash + failing
+        # I/O + exception + log
+        self._consecutive_failures = 0
+        self._breaker_open_until = 0.0
         logger.info(f"Initialized cache middleware with {default_ttl}s default TTL")
 
+    _INDEX_KEY = "cache:__index__"
+    _BREAKER_THRESHOLD = 5
+
+    def _breaker_open(self) -> bool:
+        """True while the breaker is tripped and storage should be skipped."""
+        return time.monotonic() < self._breaker_open_until
+
+    def _record_success(self) -> None:
+        self._consecutive_failures = 0
+
+    def _record_failure(self) -> None:
+        self._consecutive_failures += 1
+        if self._consecutive_failures >= self._BREAKER_THRESHOLD:
+            backoff = min(60.0, 2.0 ** self._consecutive_failures)
+            self._breaker_open_until = time.monotonic() + backoff
+            logger.warning(
+                f"Cache backend failing ({self._consecutive_failures} consecutive "
+                f"errors); bypassing cache for {backoff:.0f}s"
+            )
+
+    async def _load_index(self) -> None:
+        """Merge the persisted key index into the in-memory set (once)."""
+        if self._index_loaded:
+            return
+        self._index_loaded = True
+        try:
+            data = await self.storage.get_bytes(self._INDEX_KEY)
+            if data:
+                self._keys.update(_json_loads(data) if isinstance(data, (str, bytes)) else data)
+        except Exception as e:
+            logger.debug(f"Could not load cache key index: {e}")
+
+    async def _persist_index(self) -> None:
+        """Write the current key index to storage."""
+        try:
+            await self.storage.set_bytes(self._INDEX_KEY, _json_dumps(sorted(self._keys)))
+        except Exception as e:
+            logger.debug(f"Could not persist cache key index: {e}")
+
     def _generate_cache_key(self, tool_name: str, *args, **kwargs) -> str:
         """
         Generate a unique cache key from tool name and arguments.
@@ -103,19 +181,23 @@ class CacheMiddleware:
         Returns:
             Unique cache key string
         """
-        # Create deterministic representation of arguments
-        key_parts = [tool_name]
-
-        if args:
-            key_parts.append(json.dumps(args, sort_keys=True, default=str))
-
-        if kwargs:
-            key_parts.append(json.dumps(kwargs, sort_keys=True, default=str))
-
-        key_string = "|".join(key_parts)
-
-        # Use hash for consistent key length
-        key_hash = hashlib.sha256(key_string.encode()).hexdigest()[:16]
+        # Fast path: hash a repr of the argument structure directly.
+        # BLAKE2b is faster than SHA-256 on short inputs and avoids the two
+        # json.dumps passes per lookup. repr of builtin containers is
+        # deterministic within a process, which is all a cache key needs.
+        try:
+            key_repr = repr((args, tuple(sorted(kwargs.items()))))
+        except Exception:
+            # Exotic arguments (unsortable kwargs, broken __repr__): fall
+            # back to the slower JSON canonicalization
+            key_parts = [tool_name]
+            if args:
+                key_parts.append(json.dumps(args, sort_keys=True, default=str))
+            if kwargs:
+                key_parts.append(json.dumps(kwargs, sort_keys=True, default=str))
+            key_repr = "|".join(key_parts)
+
+        key_hash = hashlib.blake2b(key_repr.encode(), digest_size=16).hexdigest()
 
         return f"cache:{tool_name}:{key_hash}"
 
@@ -132,26 +214,165 @@ class CacheMiddleware:
             Cached response data or None if not found/expired
         """
         cache_key = self._generate_cache_key(tool_name, *args, **kwargs)
+        return await self._get_by_key(cache_key, tool_name)
+
+    async def _get_by_key(self, cache_key: str, tool_name: str) -> Optional[Any]:
+        """Retrieve a cached response by precomputed cache key."""
+        # L1 fast path: a single lock-free dict lookup
+        entry = self._l1.get(cache_key)
+        if entry is not None:
+            expires_at, _seq, data = entry
+            if expires_at > _now():
+                # Refresh recency with an atomic re-insert (no lock needed)
+                self._l1_seq += 1
+                self._l1[cache_key] = (expires_at, self._l1_seq, data)
+                logger.debug(f"L1 cache hit for {tool_name}")
+                return data
+            self._l1.pop(cache_key, None)
+
+        if self._breaker_open():
+            return None
 
         try:
-            cached = await self.storage.get(cache_key)
+            cached = await self.storage.get_bytes(cache_key)
+            self._record_success()
             if not cached:
                 return None
 
-            # Check expiration
-            expires_at = datetime.fromisoformat(cached['expires_at'])
-            if expires_at < datetime.now(timezone.utc):
+            # Entries are stored serialized; tolerate backends returning a
+            # raw dict (older in-memory implementations)
+            if isinstance(cached, (str, bytes)):
+                cached = _json_loads(cached)
+
+            # Check expiration (expires_at is a float epoch; comparing two
+            # floats beats parsing ISO timestamps on every hit)
+            if cached['expires_at'] < _now():
                 logger.debug(f"Cache expired for {tool_name}")
+                self._keys.discard(cache_key)
                 await self.storage.delete(cache_key)
                 return None
 
             logger.debug(f"Cache hit for {tool_name}")
+            await self._l1_store(cache_key, cached['expires_at'], cached['data'])
             return cached['data']
 
         except Exception as e:
+            self._record_failure()
             logger.warning(f"Cache get failed for {tool_name}: {e}")
             return None
 
+    async def get_many(self, tool_name: str, arg_list: list[dict]) -> list[Optional[Any]]:
+        """
+        Batched cache lookup for a fan-out of calls to one tool.
+
+        Precomputes all cache keys, serves what it can from L1, then fetches
+        the rest in a single storage round trip instead of one per key.
+
+        Args:
+            tool_name: Name of the tool
+            arg_list: One kwargs dict per call
+
+        Returns:
+            Cached data (or None) for each call, in input order
+        """
+        keys = [self._generate_cache_key(tool_name, **kwargs) for kwargs in arg_list]
+        results: dict[str, Optional[Any]] = {}
+        now = _now()
+
+        misses = []
+        for cache_key in keys:
+            entry = self._l1.get(cache_key)
+            if entry is not None and entry[0] > now:
+                results[cache_key] = entry[2]
+            else:
+                misses.append(cache_key)
+
+        if misses:
+            if self._breaker_open():
+                fetched = {}
+            else:
+                try:
+                    fetched = await self.storage.get_many(misses)
+                    self._record_success()
+                except Exception as e:
+                    self._record_failure()
+                    logger.warning(f"Batched cache get failed for {tool_name}: {e}")
+                    fetched = {}
+            for cache_key in misses:
+                cached = fetched.get(cache_key)
+                if not cached:
+                    results[cache_key] = None
+                    continue
+                if isinstance(cached, (str, bytes)):
+                    cached = _json_loads(cached)
+                if cached['expires_at'] < now:
+                    results[cache_key] = None
+                    continue
+                results[cache_key] = cached['data']
+                await self._l1_store(cache_key, cached['expires_at'], cached['data'])
+
+        return [results[cache_key] for cache_key in keys]
+
+    async def set_many(
+        self, tool_name: str, entries: list[tuple[dict, Any]], ttl: Optional[int] = None
+    ) -> bool:
+        """
+        Cache many responses for one tool in a single storage round trip.
+
+        Args:
+            tool_name: Name of the tool
+            entries: (kwargs, data) pairs, one per call
+            ttl: Time-to-live in seconds (uses default_ttl if None)
+
+        Returns:
+            True if successfully cached, False otherwise
+        """
+        if self._breaker_open():
+            return False
+
+        ttl = ttl if ttl is not None else self.default_ttl
+        now = _now()
+        expires_at = now + ttl
+
+        items = {}
+        payloads = {}
+        for kwargs, data in entries:
+            cache_key = self._generate_cache_key(tool_name, **kwargs)
+            items[cache_key] = _json_dumps({
+                'data': data,
+                'cached_at': now,
+                'expires_at': expires_at,
+                'ttl': ttl
+            })
+            payloads[cache_key] = data
+
+        try:
+            await self.storage.set_many(items, ttl)
+            self._record_success()
+            for cache_key, data in payloads.items():
+                await self._l1_store(cache_key, expires_at, data)
+            await self._load_index()
+            self._keys.update(items)
+            await self._persist_index()
+            logger.debug(f"Cached {len(items)} entries for {tool_name} ({ttl}s)")
+            return True
+        except Exception as e:
+            self._record_failure()
+            logger.warning(f"Batched cache set failed for {tool_name}: {e}")
+            return False
+
+    async def _l1_store(self, cache_key: str, expires_at: float, data: Any) -> None:
+        """Insert an entry into L1, evicting least-recent entries if full."""
+        self._l1_seq += 1
+        self._l1[cache_key] = (expires_at, self._l1_seq, data)
+        if len(self._l1) > self._l1_max:
+            # Slow path only: serialize eviction so concurrent writers do
+            # not scan and pop the same victims
+            async with self._l1_lock:
+                while len(self._l1) > self._l1_max:
+                    oldest = min(self._l1, key=lambda k: self._l1[k][1])
+                    self._l1.pop(oldest, None)
+
     async def set(self, tool_name: str, data: Any, ttl: Optional[int] = None,
                   *args, **kwargs) -> bool:
         """
@@ -168,22 +389,39 @@ class CacheMiddleware:
             True if successfully cached, False otherwise
         """
         cache_key = self._generate_cache_key(tool_name, *args, **kwargs)
+        return await self._set_by_key(cache_key, tool_name, data, ttl)
+
+    async def _set_by_key(
+        self, cache_key: str, tool_name: str, data: Any, ttl: Optional[int] = None
+    ) -> bool:
+        """Cache a response under a precomputed cache key."""
+        if self._breaker_open():
+            return False
+
         ttl = ttl if ttl is not None else self.default_ttl
 
-        expires_at = datetime.now(timezone.utc) + timedelta(seconds=ttl)
+        # Store timestamps as float epochs (time.time survives restarts,
+        # unlike time.monotonic, and avoids datetime object churn)
+        now = _now()
 
         cache_entry = {
             'data': data,
-            'cached_at': datetime.now(timezone.utc).isoformat(),
-            'expires_at': expires_at.isoformat(),
+            'cached_at': now,
+            'expires_at': now + ttl,
             'ttl': ttl
         }
 
         try:
-            await self.storage.set(cache_key, cache_entry)
+            await self.storage.set_bytes(cache_key, _json_dumps(cache_entry), ttl)
+            self._record_success()
+            await self._l1_store(cache_key, cache_entry['expires_at'], data)
+            await self._load_index()
+            self._keys.add(cache_key)
+            await self._persist_index()
             logger.debug(f"Cached {tool_name} for {ttl}s")
             return True
         except Exception as e:
+            self._record_failure()
             logger.warning(f"Cache set failed for {tool_name}: {e}")
             return False
 
@@ -202,7 +440,14 @@ class CacheMiddleware:
         cache_key = self._generate_cache_key(tool_name, *args, **kwargs)
 
         try:
+            self._l1.pop(cache_key, None)
+            # Hydrate the persisted index before mutating it, or the first
+            # invalidate after a restart would persist a near-empty key set
+            # and orphan every pre-restart entry
+            await self._load_index()
+            self._keys.discard(cache_key)
             await self.storage.delete(cache_key)
+            await self._persist_index()
             logger.debug(f"Invalidated cache for {tool_name}")
             return True
         except Exception as e:
@@ -213,13 +458,19 @@ class CacheMiddleware:
         """
         Clear all cached responses.
 
+        Only deletes keys recorded in the cache key index, so co-resident
+        storage (e.g. OAuth tokens) is left untouched.
+
         Returns:
             True if cache was cleared, False otherwise
         """
         try:
-            # Note: This clears ALL storage, not just cache entries
-            # In production, you might want to iterate and delete only cache:* keys
-            await self.storage.clear()
+            self._l1.clear()
+            await self._load_index()
+            if self._keys:
+                await asyncio.gather(*(self.storage.delete(k) for k in self._keys))
+                self._keys.clear()
+            await self.storage.delete(self._INDEX_KEY)
             logger.info("Cleared all cache entries")
             return True
         except Exception as e:
@@ -239,21 +490,54 @@ class CacheMiddleware:
                 # ... expensive operation ...
                 return result
         """
+        # Resolve bound methods and the effective TTL once at decoration time
+        # so the wrapper hits closure locals (LOAD_FAST) instead of repeated
+        # attribute lookups on every call
+        get_by_key = self._get_by_key
+        set_by_key = self._set_by_key
+        effective_ttl = ttl if ttl is not None else self.default_ttl
+        generate_cache_key = self._generate_cache_key
+        breaker_open = self._breaker_open
+
         def decorator(func: Callable[P, R]) -> Callable[P, R]:
+            tool_name = func.__name__
+            # Single-flight map: concurrent callers with the same key await
+            # the first caller's future instead of re-running the function
+            inflight: dict[str, asyncio.Future] = {}
+
             @wraps(func)
             async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-                tool_name = func.__name__
+                # Backend outage: skip hashing and cache plumbing entirely
+                if breaker_open():
+                    return await func(*args, **kwargs)
+
+                # Compute the key once; get/set/single-flight all reuse it
+                cache_key = generate_cache_key(tool_name, *args, **kwargs)
 
                 # Try to get from cache
-                cached_result = await self.get(tool_name, *args, **kwargs)
+                cached_result = await get_by_key(cache_key, tool_name)
                 if cached_result is not None:
                     return cached_result
 
-                # Execute function
-                result = await func(*args, **kwargs)
+                fut = inflight.get(cache_key)
+                if fut is not None:
+                    # Another caller is already computing this key
+                    return await fut
+
+                fut = asyncio.get_running_loop().create_future()
+                inflight[cache_key] = fut
+                try:
+                    result = await func(*args, **kwargs)
+                except BaseException as e:
+                    fut.set_exception(e)
+                    fut.exception()  # mark retrieved; waiters still re-raise
+                    raise
+                finally:
+                    inflight.pop(cache_key, None)
+                fut.set_result(result)
 
                 # Cache the result
-                await self.set(tool_name, result, ttl, *args, **kwargs)
+                await set_by_key(cache_key, tool_name, result, effective_ttl)
 
                 return result
 
@@ -30,6 +30,7 @@ Auto-generated by mcp_generator.
 DO NOT EDIT MANUALLY - regenerate using: python -m mcp_generator
 """
 
+import asyncio
 import json
 import logging
 import time
@@ -142,6 +143,46 @@ class OAuthTokenManager:
             logger.error(f"Failed to retrieve token for {{client_id}}: {{e}}")
             return None
 
+    async def store_tokens(
+        self, tokens: list[tuple[str, dict[str, Any]]]
+    ) -> list[bool]:
+        """
+        Store a batch of OAuth tokens for independent clients.
+
+        The writes are issued together via asyncio.gather so backend I/O
+        overlaps instead of running one roundtrip per client. Tokens that
+        need a user_id should go through store_token directly.
+
+        Args:
+            tokens: (client_id, token_data) pairs to persist
+
+        Returns:
+            Per-entry success flags, in input order
+        """
+        if not tokens:
+            return []
+        return list(
+            await asyncio.gather(
+                *(self.store_token(client_id, token_data) for client_id, token_data in tokens)
+            )
+        )
+
+    async def get_tokens(self, client_ids: list[str]) -> list[Optional[dict[str, Any]]]:
+        """
+        Retrieve stored OAuth tokens for several clients at once.
+
+        Args:
+            client_ids: OAuth client identifiers
+
+        Returns:
+            Token dicts (or None where not found), in input order
+        """
+        if not client_ids:
+            return []
+        return list(
+            await asyncio.gather(*(self.get_token(client_id) for client_id in client_ids))
+        )
+
     async def delete_token(self, client_id: str) -> bool:
         """
         Delete stored OAuth token (e.g., on logout or revocation).
@@ -21,9 +21,10 @@ Designed to work standalone or integrate with py-key-value-aio for advanced use
 
 📦 Simple Out-of-the-Box Storage:
 -----------------------------------
-Provides filesystem and memory backends with encryption support:
-- Filesystem (with Fernet encryption)
+Provides filesystem, memory and Redis backends with encryption support:
+- Filesystem (with AES-256-GCM encryption)
 - In-memory (for testing)
+- Redis (pip install redis; pooled connections, server-side TTLs)
 - OAuth token persistence
 - Simple get/set/delete API
 
@@ -58,24 +59,90 @@ See: https://github.com/strawgate/py-key-value
 
 Configuration:
     Set storage backend via environment variables:
-    - STORAGE_BACKEND: filesystem|memory
+    - STORAGE_BACKEND: filesystem|memory|redis
     - STORAGE_PATH: Path for filesystem backend (default: ./.storage)
-    - ENCRYPTION_KEY: Fernet encryption key (auto-generated if not set)
+    - ENCRYPTION_KEY: encryption key (auto-generated if not set)
 """
 
+import asyncio
+import functools
+import hashlib
+import heapq
 import json
 import os
+import threading
+import time
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any, Optional
 
-# Encryption support
+# Encryption support (AES-256-GCM: hardware AES-NI path, no base64/HMAC
+# overhead like Fernet)
 try:
-    from cryptography.fernet import Fernet
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
     CRYPTO_AVAILABLE = True
 except ImportError:
     CRYPTO_AVAILABLE = False
 
+# Optional Redis backend (pip install redis)
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+# Optional zstd compression for filesystem payloads (pip install zstandard)
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Values below this size skip compression (framing overhead dominates)
+_COMPRESS_MIN_SIZE = 1024
+_FLAG_RAW = b"\\x00"
+_FLAG_ZSTD = b"\\x01"
+
+_GCM_NONCE_SIZE = 12
+
+
+@functools.lru_cache(maxsize=None)
+def _load_or_generate_key(key_file: Path) -> bytes:
+    """Load the AES key file, creating it atomically if missing.
+
+    Memoized per path so repeated backend construction (e.g. test fixtures
+    calling get_storage with fresh kwargs) reads the key file once.
+    O_CREAT|O_EXCL makes creation first-writer-wins: a concurrent process
+    that loses the race reads the winner's key instead of overwriting it
+    (which would make existing ciphertexts unreadable).
+    """
+    if key_file.exists():
+        return key_file.read_bytes()
+    key = AESGCM.generate_key(bit_length=256)
+    try:
+        fd = os.open(key_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        return key_file.read_bytes()
+    try:
+        os.write(fd, key)
+    finally:
+        os.close(fd)
+    return key
+
+# Prefer orjson (C-accelerated) for token/entry serialization when available.
+# _json_dumps returns bytes so payloads go straight to the bytes storage API
+# without a str round-trip.
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _json_loads = json.loads
+
 
 class StorageBackend(ABC):
     """Abstract base class for storage backends."""
@@ -105,38 +172,144 @@ class StorageBackend(ABC):
         """Clear all keys (use with caution)."""
         pass
 
+    # Bytes-valued API: callers that already hold serialized payloads (e.g.
+    # the cache middleware) use these to skip the UTF-8 encode/decode copy
+    # per operation. Backends that store bytes natively should override.
+    async def get_bytes(self, key: str) -> Optional[bytes]:
+        """Retrieve raw bytes for key, or None if not found."""
+        value = await self.get(key)
+        if value is None:
+            return None
+        return value.encode("utf-8") if isinstance(value, str) else value
+
+    async def set_bytes(self, key: str, value: bytes, ttl: Optional[int] = None) -> None:
+        """Store raw bytes for key, with optional TTL in seconds."""
+        await self.set(key, value.decode("utf-8"), ttl)
+
+    # Batched API: one logical round trip for N keys. The defaults fan out
+    # with asyncio.gather; backends with native batching (Redis MGET /
+    # pipelines) should override.
+    async def get_many(self, keys: list[str]) -> dict[str, Optional[str]]:
+        """Retrieve values for many keys at once (missing keys map to None)."""
+        values = await asyncio.gather(*(self.get(key) for key in keys))
+        return dict(zip(keys, values))
+
+    async def set_many(self, items: dict[str, Any], ttl: Optional[int] = None) -> None:
+        """Store many key/value pairs at once (values may be str or bytes)."""
+        await asyncio.gather(*(
+            self.set_bytes(key, value, ttl) if isinstance(value, bytes)
+            else self.set(key, value, ttl)
+            for key, value in items.items()
+        ))
+
 
 class InMemoryStorage(StorageBackend):
-    """Simple in-memory storage for testing and development."""
+    """Simple in-memory storage for testing and development.
+
+    TTL-aware: expired keys are evicted lazily on access, and a background
+    reaper (start_reaper) removes cold expired keys so memory stays bounded.
+    """
 
     def __init__(self):
-        self._store: dict[str, str] = {}
+        # Values are stored as given (str or bytes); get/get_bytes convert
+        # only when the caller asks for the other representation
+        self._store: dict[str, Any] = {}
+        # TTL bookkeeping: authoritative expiry per key plus a heap for the
+        # reaper (heap entries may be stale after overwrites; the reaper
+        # cross-checks against _expires before evicting)
+        self._expires: dict[str, float] = {}
+        self._expire_heap: list[tuple[float, str]] = []
+        self._reaper_task: Optional[asyncio.Task] = None
+
+    def _expired(self, key: str) -> bool:
+        exp = self._expires.get(key)
+        return exp is not None and exp <= time.monotonic()
 
     async def get(self, key: str) -> Optional[str]:
-        return self._store.get(key)
+        if self._expired(key):
+            self._store.pop(key, None)
+            self._expires.pop(key, None)
+            return None
+        value = self._store.get(key)
+        if isinstance(value, bytes):
+            return value.decode("utf-8")
+        return value
+
+    async def get_bytes(self, key: str) -> Optional[bytes]:
+        if self._expired(key):
+            self._store.pop(key, None)
+            self._expires.pop(key, None)
+            return None
+        value = self._store.get(key)
+        if isinstance(value, str):
+            return value.encode("utf-8")
+        return value
 
     async def set(self, key: str, value: str, ttl: Optional[int] = None) -> None:
-        # Note: TTL not implemented for in-memory backend
         self._store[key] = value
+        if ttl is not None:
+            expire_at = time.monotonic() + ttl
+            self._expires[key] = expire_at
+            heapq.heappush(self._expire_heap, (expire_at, key))
+        else:
+            self._expires.pop(key, None)
+
+    async def set_bytes(self, key: str, value: bytes, ttl: Optional[int] = None) -> None:
+        # Same bookkeeping as set; stores the bytes without a decode copy
+        await self.set(key, value, ttl)  # type: ignore[arg-type]
 
     async def delete(self, key: str) -> None:
         self._store.pop(key, None)
+        self._expires.pop(key, None)
 
     async def exists(self, key: str) -> bool:
+        if self._expired(key):
+            self._store.pop(key, None)
+            self._expires.pop(key, None)
+            return False
         return key in self._store
 
     async def clear(self) -> None:
         self._store.clear()
+        self._expires.clear()
+        self._expire_heap.clear()
+
+    def start_reaper(self, interval: float = 5.0) -> None:
+        """Start the background task that evicts expired keys."""
+        if self._reaper_task is None or self._reaper_task.done():
+            self._reaper_task = asyncio.create_task(self._reap(interval))
+
+    def stop_reaper(self) -> None:
+        """Cancel the background reaper task."""
+        if self._reaper_task is not None:
+            self._reaper_task.cancel()
+            self._reaper_task = None
+
+    async def _reap(self, interval: float) -> None:
+        heap = self._expire_heap
+        while True:
+            now = time.monotonic()
+            while heap and heap[0][0] <= now:
+                expire_at, key = heapq.heappop(heap)
+                # Skip stale heap entries for keys that were overwritten
+                if self._expires.get(key) == expire_at:
+                    self._store.pop(key, None)
+                    self._expires.pop(key, None)
+            await asyncio.sleep(interval)
 
 
 class FilesystemStorage(StorageBackend):
     """
     Filesystem-based storage with optional encryption.
 
-    Stores keys as files in a directory. Supports optional Fernet encryption
+    Stores keys as files in a directory. Supports optional AES-256-GCM encryption
     for sensitive data like OAuth tokens.
     """
 
+    # One AESGCM instance per storage directory: the cipher setup (key
+    # schedule) is paid once even when backends are constructed repeatedly
+    _cipher_cache: dict[Path, "AESGCM"] = {}
+
     def __init__(
         self,
         storage_dir: str = ".mcp_storage",
@@ -146,68 +319,327 @@ class FilesystemStorage(StorageBackend):
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(exist_ok=True, parents=True)
         self.encrypt = encrypt and CRYPTO_AVAILABLE
+        # TTL bookkeeping: expiry epochs per key file, persisted alongside
+        # the data so the reaper works across restarts
+        self._ttl_index_path = self.storage_dir / ".ttl_index.json"
+        # Sidecar mapping file name (digest) -> original key, so keys remain
+        # enumerable despite the hashed filenames; shares _ttl_lock
+        self._key_index_path = self.storage_dir / ".key_index.json"
+        self._ttl_lock = asyncio.Lock()
+        self._reaper_task: Optional[asyncio.Task] = None
+        # zstd level 3: fast enough to be I/O-neutral, typically 3-5x on
+        # JSON payloads; smaller files also mean fewer bytes for AES-GCM
+        if ZSTD_AVAILABLE:
+            self._zstd_compress = zstandard.ZstdCompressor(level=3).compress
+            self._zstd_decompress = zstandard.ZstdDecompressor().decompress
+        else:
+            self._zstd_compress = None
+            self._zstd_decompress = None
 
         if self.encrypt:
             if encryption_key:
-                self._fernet = Fernet(encryption_key.encode())
+                self._aesgcm = AESGCM(self._normalize_key(encryption_key))
             else:
-                # Generate or load key from file
-                key_file = self.storage_dir / ".encryption_key"
-                if key_file.exists():
-                    key = key_file.read_bytes()
-                else:
-                    key = Fernet.generate_key()
-                    key_file.write_bytes(key)
-                    # Secure the key file (chmod 600 equivalent)
-                    key_file.chmod(0o600)
-                self._fernet = Fernet(key)
+                cipher = FilesystemStorage._cipher_cache.get(self.storage_dir)
+                if cipher is None:
+                    # Generate or load 32-byte AES key from file
+                    key_file = self.storage_dir / ".encryption_key"
+                    cipher = AESGCM(_load_or_generate_key(key_file))
+                    FilesystemStorage._cipher_cache[self.storage_dir] = cipher
+                self._aesgcm = cipher
         elif encrypt and not CRYPTO_AVAILABLE:
             print("⚠️  Warning: cryptography not installed, encryption disabled")
             print("   Install with: pip install cryptography")
 
-    def _get_file_path(self, key: str) -> Path:
-        """Get file path for key (sanitize key name)."""
-        safe_key = key.replace("/", "_").replace("\\\\", "_")
-        return self.storage_dir / f"{safe_key}.dat"
+    @staticmethod
+    def _normalize_key(encryption_key: str) -> bytes:
+        """Turn a user-supplied key string into 32 raw bytes for AES-256."""
+        import base64
+        try:
+            decoded = base64.urlsafe_b64decode(encryption_key.encode())
+            if len(decoded) == 32:
+                return decoded
+        except Exception:
+            pass
+        # Arbitrary passphrase: derive a fixed-length key
+        return hashlib.sha256(encryption_key.encode()).digest()
 
-    async def get(self, key: str) -> Optional[str]:
-        file_path = self._get_file_path(key)
+    def _get_file_path(self, key: str) -> Path:
+        """Get file path for key (digest-named, collision-free).
+
+        Character substitution (: / \\\\ -> _) collided (``a/b`` and ``a_b``
+        mapped to the same file) and broke on NTFS-unsafe or over-long keys.
+        A BLAKE2b digest gives uniform short filenames; the original keys
+        are kept in a sidecar index for enumeration.
+        """
+        digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        return self.storage_dir / f"{digest}.dat"
+
+    def _read_sync(self, file_path: Path) -> Optional[bytes]:
+        """Blocking read + decrypt (runs in a worker thread)."""
         if not file_path.exists():
             return None
-
         data = file_path.read_bytes()
-
         if self.encrypt:
-            data = self._fernet.decrypt(data)
+            nonce, ciphertext = data[:_GCM_NONCE_SIZE], data[_GCM_NONCE_SIZE:]
+            data = self._aesgcm.decrypt(nonce, ciphertext, None)
+        flag, data = data[:1], data[1:]
+        if flag == _FLAG_ZSTD:
+            if self._zstd_decompress is None:
+                raise RuntimeError(
+                    "Entry is zstd-compressed but zstandard is not installed. "
+                    "Install with: pip install zstandard"
+                )
+            data = self._zstd_decompress(data)
+        return data
+
+    def _write_sync(self, file_path: Path, data: bytes) -> None:
+        """Blocking compress + encrypt + write (runs in a worker thread)."""
+        if self._zstd_compress is not None and len(data) > _COMPRESS_MIN_SIZE:
+            data = _FLAG_ZSTD + self._zstd_compress(data)
+        else:
+            data = _FLAG_RAW + data
+        if self.encrypt:
+            nonce = os.urandom(_GCM_NONCE_SIZE)
+            data = nonce + self._aesgcm.encrypt(nonce, data, None)
+        file_path.write_bytes(data)
 
-        return data.decode("utf-8")
+    async def get(self, key: str) -> Optional[str]:
+        data = await self.get_bytes(key)
+        return data.decode("utf-8") if data is not None else None
+
+    async def get_bytes(self, key: str) -> Optional[bytes]:
+        # Offload file I/O + crypto so the event loop stays free; the bytes
+        # path skips the UTF-8 decode copy entirely
+        return await asyncio.to_thread(self._read_sync, self._get_file_path(key))
+
+    def _load_ttl_index_sync(self) -> dict[str, float]:
+        if not self._ttl_index_path.exists():
+            return {}
+        try:
+            return json.loads(self._ttl_index_path.read_text(encoding="utf-8"))
+        except Exception:
+            return {}
+
+    def _record_ttl_sync(self, file_name: str, expire_at: float) -> None:
+        index = self._load_ttl_index_sync()
+        index[file_name] = expire_at
+        self._ttl_index_path.write_text(json.dumps(index), encoding="utf-8")
+
+    def _drop_ttl_sync(self, file_name: str) -> None:
+        index = self._load_ttl_index_sync()
+        if index.pop(file_name, None) is not None:
+            self._ttl_index_path.write_text(json.dumps(index), encoding="utf-8")
+
+    def _load_key_index_sync(self) -> dict[str, str]:
+        if not self._key_index_path.exists():
+            return {}
+        try:
+            return json.loads(self._key_index_path.read_text(encoding="utf-8"))
+        except Exception:
+            return {}
+
+    def _record_key_sync(self, file_name: str, key: str) -> None:
+        index = self._load_key_index_sync()
+        if index.get(file_name) != key:
+            index[file_name] = key
+            self._key_index_path.write_text(json.dumps(index), encoding="utf-8")
+
+    def _forget_key_sync(self, file_name: str) -> None:
+        index = self._load_key_index_sync()
+        if index.pop(file_name, None) is not None:
+            self._key_index_path.write_text(json.dumps(index), encoding="utf-8")
+
+    def _reap_sync(self) -> None:
+        """Unlink expired key files and prune the TTL index."""
+        index = self._load_ttl_index_sync()
+        if not index:
+            return
+        now = time.time()
+        remaining = {}
+        dropped = []
+        for file_name, expire_at in index.items():
+            file_path = self.storage_dir / file_name
+            if expire_at <= now:
+                if file_path.exists():
+                    file_path.unlink()
+                dropped.append(file_name)
+            elif file_path.exists():
+                remaining[file_name] = expire_at
+            else:
+                dropped.append(file_name)
+        if remaining != index:
+            self._ttl_index_path.write_text(json.dumps(remaining), encoding="utf-8")
+        if dropped:
+            key_index = self._load_key_index_sync()
+            pruned = {n: k for n, k in key_index.items() if n not in dropped}
+            if pruned != key_index:
+                self._key_index_path.write_text(json.dumps(pruned), encoding="utf-8")
 
     async def set(self, key: str, value: str, ttl: Optional[int] = None) -> None:
-        file_path = self._get_file_path(key)
-
-        data = value.encode("utf-8")
+        await self.set_bytes(key, value.encode("utf-8"), ttl)
 
-        if self.encrypt:
-            data = self._fernet.encrypt(data)
-
-        file_path.write_bytes(data)
-        # Note: TTL requires background cleanup task (not implemented in basic version)
+    async def set_bytes(self, key: str, value: bytes, ttl: Optional[int] = None) -> None:
+        file_path = self._get_file_path(key)
+        await asyncio.to_thread(self._write_sync, file_path, value)
+        async with self._ttl_lock:
+            await asyncio.to_thread(self._record_key_sync, file_path.name, key)
+            if ttl is not None:
+                await asyncio.to_thread(self._record_ttl_sync, file_path.name, time.time() + ttl)
+            else:
+                # Overwriting without a TTL must clear any previous expiry,
+                # or the reaper would later unlink the live file (mirrors
+                # InMemoryStorage.set popping _expires)
+                await asyncio.to_thread(self._drop_ttl_sync, file_path.name)
+
+    def start_reaper(self, interval: float = 60.0) -> None:
+        """Start the background task that deletes expired key files."""
+        if self._reaper_task is None or self._reaper_task.done():
+            self._reaper_task = asyncio.create_task(self._reap(interval))
+
+    def stop_reaper(self) -> None:
+        """Cancel the background reaper task."""
+        if self._reaper_task is not None:
+            self._reaper_task.cancel()
+            self._reaper_task = None
+
+    async def _reap(self, interval: float) -> None:
+        while True:
+            async with self._ttl_lock:
+                await asyncio.to_thread(self._reap_sync)
+            await asyncio.sleep(interval)
 
     async def delete(self, key: str) -> None:
         file_path = self._get_file_path(key)
-        if file_path.exists():
-            file_path.unlink()
+
+        def _unlink() -> None:
+            if file_path.exists():
+                file_path.unlink()
+
+        await asyncio.to_thread(_unlink)
+        async with self._ttl_lock:
+            await asyncio.to_thread(self._forget_key_sync, file_path.name)
+            # Drop the expiry too, so a later re-set of the same key cannot
+            # inherit this entry's TTL
+            await asyncio.to_thread(self._drop_ttl_sync, file_path.name)
 
     async def exists(self, key: str) -> bool:
-        return self._get_file_path(key).exists()
+        return await asyncio.to_thread(self._get_file_path(key).exists)
+
+    async def keys(self) -> list[str]:
+        """List all stored keys (from the sidecar key index)."""
+        async with self._ttl_lock:
+            index = await asyncio.to_thread(self._load_key_index_sync)
+        return list(index.values())
 
     async def clear(self) -> None:
-        for file in self.storage_dir.glob("*.dat"):
-            file.unlink()
+        files = await asyncio.to_thread(list, self.storage_dir.glob("*.dat"))
+        if files:
+            await asyncio.gather(*(asyncio.to_thread(f.unlink) for f in files))
 
+        def _drop_key_index() -> None:
+            if self._key_index_path.exists():
+                self._key_index_path.unlink()
 
-# Storage instance cache
-_storage_instance: Optional[Any] = None
+        async with self._ttl_lock:
+            await asyncio.to_thread(_drop_key_index)
+
+
+class RedisStorage(StorageBackend):
+    """
+    Redis-backed storage with native TTLs and a shared connection pool.
+
+    Pass an externally managed ``redis.asyncio.Redis`` client to share its
+    pool with other components, or give a URL and a bounded pool is created
+    (connection setup is paid once, not per operation). TTLs use Redis
+    ``EX`` so expiry happens server-side — no background reaper needed.
+
+    All keys live under ``namespace`` so this backend can share a database
+    with other applications; ``clear()`` only touches that namespace.
+    """
+
+    def __init__(
+        self,
+        client: Optional[Any] = None,
+        url: str = "redis://localhost:6379/0",
+        max_connections: int = 50,
+        namespace: str = "mcp:",
+    ):
+        if not REDIS_AVAILABLE:
+            raise RuntimeError(
+                "redis package not installed. Install with: pip install redis"
+            )
+        # Keep the namespace free of glob metacharacters: clear() uses it
+        # as a SCAN match pattern
+        self.namespace = namespace
+        if client is not None:
+            self.client = client
+        else:
+            pool = aioredis.ConnectionPool.from_url(url, max_connections=max_connections)
+            self.client = aioredis.Redis(connection_pool=pool)
+
+    def _k(self, key: str) -> str:
+        """Prefix a caller key with this backend's namespace."""
+        return self.namespace + key
+
+    async def get(self, key: str) -> Optional[str]:
+        value = await self.client.get(self._k(key))
+        if isinstance(value, bytes):
+            return value.decode("utf-8")
+        return value
+
+    async def get_bytes(self, key: str) -> Optional[bytes]:
+        return await self.client.get(self._k(key))
+
+    async def set(self, key: str, value: str, ttl: Optional[int] = None) -> None:
+        await self.client.set(self._k(key), value, ex=ttl)
+
+    async def set_bytes(self, key: str, value: bytes, ttl: Optional[int] = None) -> None:
+        await self.client.set(self._k(key), value, ex=ttl)
+
+    async def get_many(self, keys: list[str]) -> dict[str, Optional[str]]:
+        if not keys:
+            return {}
+        values = await self.client.mget([self._k(key) for key in keys])
+        return {
+            key: (value.decode("utf-8") if isinstance(value, bytes) else value)
+            for key, value in zip(keys, values)
+        }
+
+    async def set_many(self, items: dict[str, Any], ttl: Optional[int] = None) -> None:
+        if not items:
+            return
+        # Pipelined SETs: one round trip instead of one per key
+        pipe = self.client.pipeline(transaction=False)
+        for key, value in items.items():
+            pipe.set(self._k(key), value, ex=ttl)
+        await pipe.execute()
+
+    async def delete(self, key: str) -> None:
+        await self.client.delete(self._k(key))
+
+    async def exists(self, key: str) -> bool:
+        return bool(await self.client.exists(self._k(key)))
+
+    async def clear(self) -> None:
+        # SCAN over this backend's namespace + UNLINK in batches:
+        # non-blocking on the server, and scoped so keys owned by other
+        # applications on the same db are untouched (FLUSHDB, or an
+        # unscoped scan, would take them too)
+        batch: list[str] = []
+        async for key in self.client.scan_iter(match=self.namespace + "*", count=500):
+            batch.append(key)
+            if len(batch) >= 500:
+                await self.client.unlink(*batch)
+                batch.clear()
+        if batch:
+            await self.client.unlink(*batch)
+
+
+# Storage instance cache: one instance per (backend, config) combination so
+# e.g. a memory backend and a filesystem backend can coexist in one process
+_instances: dict[tuple, StorageBackend] = {}
+_instances_lock = threading.Lock()
 
 
 def get_storage(
@@ -215,14 +647,20 @@ def get_storage(
     **kwargs
 ) -> Any:
     """
-    Get storage backend instance (singleton pattern).
+    Get storage backend instance (cached per backend + configuration).
+
+    Repeated calls with the same backend and kwargs return the same
+    instance; different configurations get their own instances. The old
+    module-global singleton returned the first instance regardless of
+    arguments, which silently ignored later configurations.
 
     Args:
-        backend: Backend type ("filesystem" or "memory")
+        backend: Backend type ("filesystem", "memory", or "redis")
         **kwargs: Additional backend-specific configuration
             - storage_dir: Directory for filesystem storage (default: .mcp_storage)
             - encrypt: Enable encryption for filesystem storage (default: True)
-            - encryption_key: Custom Fernet encryption key (optional)
+            - encryption_key: Custom encryption key (optional)
+            - url / client / max_connections: Redis backend configuration
 
     Returns:
         Storage backend instance
@@ -234,20 +672,29 @@ def get_storage(
         # In-memory for testing
         storage = get_storage("memory")
     """
-    global _storage_instance
-
-    if _storage_instance is None:
-        if backend == "memory":
-            _storage_instance = InMemoryStorage()
-        elif backend == "filesystem":
-            _storage_instance = FilesystemStorage(**kwargs)
-        else:
-            raise ValueError(
-                f"Unknown storage backend: {backend}. "
-                f"Available: filesystem, memory"
-            )
+    cache_key = (backend, frozenset(kwargs.items()))
+
+    instance = _instances.get(cache_key)
+    if instance is not None:
+        return instance
+
+    with _instances_lock:
+        instance = _instances.get(cache_key)
+        if instance is None:
+            if backend == "memory":
+                instance = InMemoryStorage()
+            elif backend == "filesystem":
+                instance = FilesystemStorage(**kwargs)
+            elif backend == "redis":
+                instance = RedisStorage(**kwargs)
+            else:
+                raise ValueError(
+                    f"Unknown storage backend: {backend}. "
+                    f"Available: filesystem, memory, redis"
+                )
+            _instances[cache_key] = instance
 
-    return _storage_instance
+    return instance
 
 
 # OAuth token persistence helpers
@@ -261,13 +708,13 @@ class TokenStore:
     async def save_token(self, client_id: str, token_data: dict) -> None:
         """Save OAuth token data for a client."""
         key = f"oauth:token:{client_id}"
-        await self.storage.set(key, json.dumps(token_data))
+        await self.storage.set_bytes(key, _json_dumps(token_data))
 
     async def get_token(self, client_id: str) -> Optional[dict]:
         """Retrieve OAuth token data for a client."""
         key = f"oauth:token:{client_id}"
-        data = await self.storage.get(key)
-        return json.loads(data) if data else None
+        data = await self.storage.get_bytes(key)
+        return _json_loads(data) if data else None
 
     async def delete_token(self, client_id: str) -> None:
         """Delete OAuth token for a client."""
@@ -277,10 +724,10 @@ class TokenStore:
     async def list_clients(self) -> list[str]:
         """List all client IDs with stored tokens (filesystem only)."""
         if isinstance(self.storage, FilesystemStorage):
-            tokens = []
-            for file in self.storage.storage_dir.glob("oauth_token_*.dat"):
-                client_id = file.stem.replace("oauth_token_", "")
-                tokens.append(client_id)
-            return tokens
+            # Filenames are digests, so enumerate via the key index instead
+            # of parsing names off disk
+            prefix = "oauth:token:"
+            keys = await self.storage.keys()
+            return [key[len(prefix):] for key in keys if key.startswith(prefix)]
         return []
 '''
@@ -0,0 +1,22 @@
+"""
+Template for generating the shared pytest conftest for generated tests.
+"""
+
+
+def generate_test_conftest() -> str:
+    """Generate a conftest.py shared by all generated test modules."""
+    return '''"""
+Shared pytest configuration for generated tests.
+
+Makes the generated MCP modules importable for every test module in this
+directory. Pytest loads this once per session, so the sys.path surgery and
+import probing is not repeated per collected test file.
+"""
+
+import sys
+from pathlib import Path
+
+_generated_mcp_dir = Path(__file__).parent.parent.parent / "generated_mcp"
+if str(_generated_mcp_dir) not in sys.path:
+    sys.path.insert(0, str(_generated_mcp_dir))
+'''
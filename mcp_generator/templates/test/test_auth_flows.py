@@ -11,7 +11,7 @@ def generate_auth_flow_tests(
     api_metadata: ApiMetadata,
     security_config: SecurityConfig,
     modules: dict[str, ModuleSpec],
-    available_flows: set[str],
+    available_flows: frozenset[str],
 ) -> str:
     """
     Generate authentication flow demonstration tests.
@@ -58,7 +58,8 @@ def generate_auth_flow_tests(
     flows_list = ", ".join(available_flows) if available_flows else "None configured"
 
     # Generate header
-    code = f'''"""
+    sections = [
+        f'''"""
 Generated Authentication Flow Tests for {api_metadata.title}
 
 This file demonstrates different authentication flows supported by the MCP server.
@@ -139,10 +140,11 @@ class TestAuthenticationFlows:
     3. Call MCP tools with proper authentication
     """
 '''
+    ]
 
     # Add OAuth2 Client Credentials flow test
     if has_client_credentials:
-        code += '''
+        sections.append('''
 
     @pytest.mark.asyncio
     async def test_oauth2_client_credentials_flow(
@@ -245,11 +247,11 @@ class TestAuthenticationFlows:
 
             assert tools_response.status_code == 200
             print(f"✅ Tools retrieved successfully")
-'''
+''')
 
         # Add sample tool call if available
         if sample_tool:
-            code += f'''
+            sections.append(f'''
 
             # Step 4: Call a sample tool
             print("\\n📝 Step 4: Calling sample tool '{sample_tool}'...")
@@ -280,11 +282,11 @@ class TestAuthenticationFlows:
                 # Note: Tool may require specific arguments or return 401 if backend auth is needed
             except Exception as e:
                 print(f"⚠️  Tool call example: {{e}}")
-'''
+''')
 
     # Add JWT Bearer Token test
     if has_bearer:
-        code += '''
+        sections.append('''
 
     @pytest.mark.asyncio
     async def test_bearer_token_authentication(
@@ -348,10 +350,10 @@ class TestAuthenticationFlows:
                 )
 
                 print(f"✅ Request completed: {response.status_code}")
-'''
+''')
 
     # Add error handling demonstration
-    code += '''
+    sections.append('''
 
     @pytest.mark.asyncio
     async def test_authentication_errors(self, mcp_server_url):
@@ -396,11 +398,11 @@ class TestAuthenticationFlows:
 
             print(f"Invalid token: Status {response.status_code}")
             print(f"Response: {response.text[:200]}")
-'''
+''')
 
     # Add token refresh flow documentation (skipped test)
     if has_authorization_code or has_password:
-        code += '''
+        sections.append('''
 
     @pytest.mark.asyncio
     async def test_token_refresh_flow(self, backend_api_url):
@@ -425,10 +427,10 @@ class TestAuthenticationFlows:
             "client_secret=<your_client_secret>\\n\\n"
             "Response will contain new access_token and refresh_token."
         )
-'''
+''')
 
     # Add complete workflow example
-    code += f'''
+    sections.append(f'''
 
 
 class TestAuthenticationExamples:
@@ -593,6 +595,6 @@ if __name__ == "__main__":
 
     Note: Tests will be skipped if OAuth credentials are not configured.
     """)
-'''
+''')
 
-    return code
+    return "".join(sections)
@@ -2,10 +2,10 @@
 Template for generating cache middleware tests.
 """
 
-
-def generate_cache_tests() -> str:
-    """Generate comprehensive tests for cache middleware."""
-    return '''"""
+# Bound once at import: generate_cache_tests is called per generated
+# project, and returning the module-level constant avoids rebuilding the
+# multi-KB literal on every call
+_CACHE_TESTS_SRC = '''"""
 Tests for cache middleware functionality.
 
 Tests cover:
@@ -14,34 +14,93 @@ Tests cover:
 - Cache key generation
 - Decorator usage
 - Cache invalidation
+
+Runs under pytest (pytest-asyncio, auto mode) or standalone via
+``python test_cache_generated.py``.
 """
 
 import asyncio
-import json
+import logging
 import sys
 import tempfile
-from datetime import datetime, timedelta, timezone
+import time
 from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "generated_mcp"))
+import pytest
+
+# Status lines go through logging instead of print: pytest suppresses them
+# by default (enable with -o log_cli_level=DEBUG) and the async suite is
+# not serialized on stdout flushes
+log = logging.getLogger(__name__)
+
+# Under pytest the shared conftest.py has already made the generated
+# modules importable; standalone execution does it here
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent / "generated_mcp"))
 
 try:
+    import cache as cache_module
     from storage import get_storage
     from cache import get_cache_middleware
+    CACHE_AVAILABLE = True
+except ImportError as e:
+    CACHE_AVAILABLE = False
+    IMPORT_ERROR = str(e)
+    # Don't exit during import - pytest needs to collect tests
+    if __name__ == "__main__":
+        print("⚠️  Skipped: Cache and storage modules not generated")
+        print("   Run with: uv run generate-mcp --enable-storage --enable-caching")
+        sys.exit(0)
+
+pytestmark = pytest.mark.skipif(
+    not CACHE_AVAILABLE,
+    reason=f"Cache not generated: {IMPORT_ERROR if not CACHE_AVAILABLE else 'N/A'}"
+)
+
+try:
+    import pytest_benchmark  # noqa: F401
+    BENCHMARK_AVAILABLE = True
 except ImportError:
-    print("⚠️  Skipped: Cache and storage modules not generated")
-    print("   Run with: uv run generate-mcp --enable-storage --enable-caching")
-    sys.exit(0)
+    BENCHMARK_AVAILABLE = False
+
+
+def _make_cache(default_ttl: int = 300):
+    """Build a cache middleware over in-memory storage."""
+    return get_cache_middleware(get_storage("memory"), default_ttl=default_ttl)
+
+
+@pytest.fixture
+def cache():
+    """Cache middleware over in-memory storage (5 minute TTL)."""
+    return _make_cache()
 
 
-async def test_cache_hit_miss():
-    """Test basic cache hit and miss behavior."""
-    print("\\n🧪 Testing Cache Hit/Miss...")
+@pytest.fixture
+def expiring_cache():
+    """Cache middleware with a 1 second default TTL for expiry tests."""
+    return _make_cache(default_ttl=1)
 
-    # Use in-memory storage for tests
-    storage = get_storage("memory")
-    cache = get_cache_middleware(storage, default_ttl=300)
+
+@pytest.fixture
+def fs_storage(tmp_path):
+    """Filesystem storage rooted in a pytest-managed temp directory."""
+    return get_storage("filesystem", storage_dir=str(tmp_path))
+
+
+@pytest.fixture(params=["memory", "filesystem"])
+def backend_cache(request, tmp_path):
+    """Cache middleware parametrized over both storage backends."""
+    if request.param == "filesystem":
+        storage = get_storage("filesystem", storage_dir=str(tmp_path))
+    else:
+        storage = get_storage("memory")
+    return get_cache_middleware(storage, default_ttl=300)
+
+
+async def test_cache_hit_miss(backend_cache):
+    """Test basic cache hit and miss behavior on each backend."""
+    log.info("🧪 Testing Cache Hit/Miss...")
+    cache = backend_cache
 
     tool_name = "test_tool"
     test_data = {"result": "expensive computation"}
@@ -49,88 +108,84 @@ async def test_cache_hit_miss():
     # First call should be a cache miss
     cached = await cache.get(tool_name, arg1="value1", arg2="value2")
     assert cached is None, "❌ Expected cache miss on first call"
-    print("   ✅ Cache miss on first call")
+    log.debug("✅ Cache miss on first call")
 
     # Set cache
     success = await cache.set(tool_name, test_data, None, arg1="value1", arg2="value2")
     assert success, "❌ Failed to set cache"
-    print("   ✅ Cache set successfully")
+    log.debug("✅ Cache set successfully")
 
     # Second call should be a cache hit
     cached = await cache.get(tool_name, arg1="value1", arg2="value2")
     assert cached == test_data, "❌ Expected cache hit with matching data"
-    print("   ✅ Cache hit with correct data")
+    log.debug("✅ Cache hit with correct data")
 
     # Different args should be a cache miss
     cached = await cache.get(tool_name, arg1="different", arg2="values")
     assert cached is None, "❌ Expected cache miss with different args"
-    print("   ✅ Cache miss with different args")
+    log.debug("✅ Cache miss with different args")
 
 
-async def test_cache_ttl_expiration():
+async def test_cache_ttl_expiration(expiring_cache, monkeypatch):
     """Test that cache entries expire based on TTL."""
-    print("\\n🧪 Testing Cache TTL Expiration...")
-
-    storage = get_storage("memory")
-    cache = get_cache_middleware(storage, default_ttl=1)  # 1 second TTL
+    log.info("🧪 Testing Cache TTL Expiration...")
 
+    cache = expiring_cache
     tool_name = "expiring_tool"
     test_data = {"result": "will expire"}
 
+    # Fake clock: advance time synthetically instead of sleeping, so the
+    # test is deterministic and does not block for the real TTL
+    fake_now = {"t": time.time()}
+    monkeypatch.setattr(cache_module, "_now", lambda: fake_now["t"])
+
     # Set cache with 1 second TTL
     await cache.set(tool_name, test_data, 1, arg="test")
-    print("   ✅ Cache entry created with 1s TTL")
+    log.debug("✅ Cache entry created with 1s TTL")
 
     # Should hit immediately
     cached = await cache.get(tool_name, arg="test")
     assert cached == test_data, "❌ Expected cache hit immediately"
-    print("   ✅ Cache hit before expiration")
+    log.debug("✅ Cache hit before expiration")
 
-    # Wait for expiration
-    print("   ⏳ Waiting 1.5 seconds for expiration...")
-    await asyncio.sleep(1.5)
+    # Advance the clock past the TTL
+    fake_now["t"] += 2
+    log.debug("⏳ Advanced clock 2 seconds past expiration")
 
     # Should miss after expiration
     cached = await cache.get(tool_name, arg="test")
     assert cached is None, "❌ Expected cache miss after TTL expiration"
-    print("   ✅ Cache miss after TTL expiration")
+    log.debug("✅ Cache miss after TTL expiration")
 
 
-async def test_cache_key_generation():
+async def test_cache_key_generation(cache):
     """Test that cache keys are generated consistently and uniquely."""
-    print("\\n🧪 Testing Cache Key Generation...")
-
-    storage = get_storage("memory")
-    cache = get_cache_middleware(storage, default_ttl=300)
-
-    # Same args should generate same key
-    key1 = cache._generate_cache_key("tool", "arg1", "arg2", kwarg="value")
-    key2 = cache._generate_cache_key("tool", "arg1", "arg2", kwarg="value")
-    assert key1 == key2, "❌ Same args should generate same cache key"
-    print("   ✅ Consistent key generation for same args")
-
-    # Different args should generate different keys
-    key3 = cache._generate_cache_key("tool", "different", "args")
-    assert key1 != key3, "❌ Different args should generate different keys"
-    print("   ✅ Different keys for different args")
-
-    # Different tool names should generate different keys
-    key4 = cache._generate_cache_key("other_tool", "arg1", "arg2", kwarg="value")
-    assert key1 != key4, "❌ Different tools should generate different keys"
-    print("   ✅ Different keys for different tool names")
-
-    # Arg order matters for positional args
-    key5 = cache._generate_cache_key("tool", "arg2", "arg1", kwarg="value")
-    assert key1 != key5, "❌ Arg order should affect cache key"
-    print("   ✅ Positional arg order affects cache key")
-
-
-async def test_cache_decorator():
+    log.info("🧪 Testing Cache Key Generation...")
+
+    # Argument combinations that must all map to distinct keys: varying
+    # args, tool name, and positional order. Running them through one loop
+    # keeps the hash path hot instead of re-parsing separate call sites.
+    pairs = [
+        (("tool", "arg1", "arg2"), {"kwarg": "value"}),
+        (("tool", "different", "args"), {}),
+        (("other_tool", "arg1", "arg2"), {"kwarg": "value"}),
+        (("tool", "arg2", "arg1"), {"kwarg": "value"}),
+    ]
+    keys = [cache._generate_cache_key(*args, **kwargs) for args, kwargs in pairs]
+
+    assert len(set(keys)) == len(pairs), "❌ All argument combinations should get distinct keys"
+    log.debug("✅ Distinct keys for distinct tool/args combinations")
+
+    # Same args should deterministically generate the same key
+    args, kwargs = pairs[0]
+    assert keys[0] == cache._generate_cache_key(*args, **kwargs), \\
+        "❌ Same args should generate same cache key"
+    log.debug("✅ Consistent key generation for same args")
+
+
+async def test_cache_decorator(cache):
     """Test the @cached decorator functionality."""
-    print("\\n🧪 Testing Cache Decorator...")
-
-    storage = get_storage("memory")
-    cache = get_cache_middleware(storage, default_ttl=300)
+    log.info("🧪 Testing Cache Decorator...")
 
     # Track how many times function is called
     call_count = {"count": 0}
@@ -139,34 +194,33 @@ async def test_cache_decorator():
     async def expensive_function(x: int, y: int) -> dict:
         """Simulate an expensive operation."""
         call_count["count"] += 1
-        await asyncio.sleep(0.01)  # Simulate work
+        # Yield to the loop once so the decorator's await path is
+        # exercised without paying a real timer delay
+        await asyncio.sleep(0)
         return {"result": x + y, "computed": True}
 
     # First call should execute the function
     result1 = await expensive_function(5, 3)
     assert result1 == {"result": 8, "computed": True}, "❌ Wrong result"
     assert call_count["count"] == 1, "❌ Function should be called once"
-    print("   ✅ First call executes function")
+    log.debug("✅ First call executes function")
 
     # Second call with same args should use cache
     result2 = await expensive_function(5, 3)
     assert result2 == {"result": 8, "computed": True}, "❌ Cached result mismatch"
     assert call_count["count"] == 1, "❌ Function should not be called again"
-    print("   ✅ Second call uses cache (function not executed)")
+    log.debug("✅ Second call uses cache (function not executed)")
 
     # Different args should execute function again
     result3 = await expensive_function(10, 20)
     assert result3 == {"result": 30, "computed": True}, "❌ Wrong result"
     assert call_count["count"] == 2, "❌ Function should be called for different args"
-    print("   ✅ Different args execute function")
+    log.debug("✅ Different args execute function")
 
 
-async def test_cache_invalidation():
+async def test_cache_invalidation(cache):
     """Test cache invalidation."""
-    print("\\n🧪 Testing Cache Invalidation...")
-
-    storage = get_storage("memory")
-    cache = get_cache_middleware(storage, default_ttl=300)
+    log.info("🧪 Testing Cache Invalidation...")
 
     tool_name = "invalidate_test"
     test_data = {"result": "data"}
@@ -175,106 +229,160 @@ async def test_cache_invalidation():
     await cache.set(tool_name, test_data, None, arg="value")
     cached = await cache.get(tool_name, arg="value")
     assert cached == test_data, "❌ Cache should be set"
-    print("   ✅ Cache entry created")
+    log.debug("✅ Cache entry created")
 
     # Invalidate specific entry
     success = await cache.invalidate(tool_name, arg="value")
     assert success, "❌ Invalidation should succeed"
-    print("   ✅ Cache invalidated")
+    log.debug("✅ Cache invalidated")
 
     # Should be a miss now
     cached = await cache.get(tool_name, arg="value")
     assert cached is None, "❌ Cache should be invalidated"
-    print("   ✅ Cache miss after invalidation")
+    log.debug("✅ Cache miss after invalidation")
 
 
-async def test_cache_clear_all():
+async def test_cache_clear_all(cache):
     """Test clearing all cached entries."""
-    print("\\n🧪 Testing Cache Clear All...")
-
-    storage = get_storage("memory")
-    cache = get_cache_middleware(storage, default_ttl=300)
+    log.info("🧪 Testing Cache Clear All...")
 
-    # Set multiple cache entries
-    await cache.set("tool1", {"data": 1}, None, arg="a")
-    await cache.set("tool2", {"data": 2}, None, arg="b")
-    await cache.set("tool3", {"data": 3}, None, arg="c")
-    print("   ✅ Created 3 cache entries")
+    # Set multiple cache entries (independent keys, so set concurrently)
+    await asyncio.gather(
+        cache.set("tool1", {"data": 1}, None, arg="a"),
+        cache.set("tool2", {"data": 2}, None, arg="b"),
+        cache.set("tool3", {"data": 3}, None, arg="c"),
+    )
+    log.debug("✅ Created 3 cache entries")
 
     # Verify they exist
-    assert await cache.get("tool1", arg="a") is not None
-    assert await cache.get("tool2", arg="b") is not None
-    assert await cache.get("tool3", arg="c") is not None
-    print("   ✅ All entries accessible")
+    cached = await asyncio.gather(
+        cache.get("tool1", arg="a"),
+        cache.get("tool2", arg="b"),
+        cache.get("tool3", arg="c"),
+    )
+    assert cached == [{"data": 1}, {"data": 2}, {"data": 3}], "❌ All entries should exist"
+    log.debug("✅ All entries accessible")
 
     # Clear all
     success = await cache.clear_all()
     assert success, "❌ Clear all should succeed"
-    print("   ✅ Cache cleared")
+    log.debug("✅ Cache cleared")
 
     # All should be misses now
-    assert await cache.get("tool1", arg="a") is None
-    assert await cache.get("tool2", arg="b") is None
-    assert await cache.get("tool3", arg="c") is None
-    print("   ✅ All entries removed")
+    cached = await asyncio.gather(
+        cache.get("tool1", arg="a"),
+        cache.get("tool2", arg="b"),
+        cache.get("tool3", arg="c"),
+    )
+    assert cached == [None, None, None], "❌ All entries should be cleared"
+    log.debug("✅ All entries removed")
 
 
-async def test_cache_with_filesystem_storage():
-    """Test cache with filesystem storage backend."""
-    print("\\n🧪 Testing Cache with Filesystem Storage...")
+async def test_cache_persistence_across_instances(fs_storage):
+    """Test that filesystem-backed entries survive a middleware restart."""
+    log.info("🧪 Testing Cache Persistence Across Instances...")
+
+    cache = get_cache_middleware(fs_storage, default_ttl=300)
+    tool_name = "fs_test"
+    test_data = {"result": "filesystem data"}
+
+    await cache.set(tool_name, test_data, None, arg="test")
+    log.debug("✅ Cache stored to filesystem")
+
+    # Create new cache instance with same storage (simulate restart)
+    cache2 = get_cache_middleware(fs_storage, default_ttl=300)
+    cached = await cache2.get(tool_name, arg="test")
+    assert cached == test_data, "❌ Cache should persist across instances"
+    log.debug("✅ Cache persists across cache instances")
+
+
+@pytest.mark.skipif(not BENCHMARK_AVAILABLE, reason="pytest-benchmark not installed")
+def test_cache_keygen_benchmark(cache, benchmark):
+    """Benchmark cache key generation — the hot path of every cache op.
+
+    Guards the tight hash/serialize kernel against regressions; run with
+    ``pytest --benchmark-only`` for timings.
+    """
+    key = benchmark(cache._generate_cache_key, "tool", "a", "b", kwarg="v")
+    assert key.startswith("cache:tool:")
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        storage = get_storage("filesystem", base_dir=tmpdir)
-        cache = get_cache_middleware(storage, default_ttl=300)
 
-        tool_name = "fs_test"
-        test_data = {"result": "filesystem data"}
+async def _run_ttl_test():
+    """Run the TTL test with a standalone MonkeyPatch for the fake clock."""
+    mp = pytest.MonkeyPatch()
+    try:
+        await test_cache_ttl_expiration(_make_cache(default_ttl=1), mp)
+    finally:
+        mp.undo()
+
 
-        # Set cache
-        await cache.set(tool_name, test_data, None, arg="test")
-        print("   ✅ Cache stored to filesystem")
+async def _run_fs_hit_miss(base_dir):
+    """Run the hit/miss test against filesystem storage (standalone mode)."""
+    storage = get_storage("filesystem", storage_dir=str(base_dir / "hit_miss"))
+    await test_cache_hit_miss(get_cache_middleware(storage, default_ttl=300))
 
-        # Get cache
-        cached = await cache.get(tool_name, arg="test")
-        assert cached == test_data, "❌ Failed to retrieve from filesystem cache"
-        print("   ✅ Cache retrieved from filesystem")
 
-        # Create new cache instance with same storage (simulate restart)
-        cache2 = get_cache_middleware(storage, default_ttl=300)
-        cached2 = await cache2.get(tool_name, arg="test")
-        assert cached2 == test_data, "❌ Cache should persist across instances"
-        print("   ✅ Cache persists across cache instances")
+async def _run_fs_persistence(base_dir):
+    """Run the persistence test against filesystem storage (standalone mode)."""
+    await test_cache_persistence_across_instances(
+        get_storage("filesystem", storage_dir=str(base_dir / "persistence"))
+    )
 
 
 async def main():
-    """Run all cache tests."""
+    """Run all cache tests concurrently."""
     print("=" * 80)
     print("Cache Middleware Test Suite")
     print("=" * 80)
 
-    try:
-        await test_cache_hit_miss()
-        await test_cache_ttl_expiration()
-        await test_cache_key_generation()
-        await test_cache_decorator()
-        await test_cache_invalidation()
-        await test_cache_clear_all()
-        await test_cache_with_filesystem_storage()
-
-        print("\\n" + "=" * 80)
-        print("✅ All cache tests passed!")
-        print("=" * 80)
-
-    except AssertionError as e:
-        print(f"\\n❌ Test failed: {e}")
-        sys.exit(1)
-    except Exception as e:
-        print(f"\\n❌ Unexpected error: {e}")
-        import traceback
-        traceback.print_exc()
+    # Tests use independent cache instances and disjoint keys, so the event
+    # loop can overlap their awaits instead of running them back to back.
+    # One shared temp directory (cleaned in a single sweep) serves all
+    # filesystem-backed tests instead of a mkdtemp/rmtree cycle per test.
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base_dir = Path(tmpdir)
+        named = [
+            ("cache_hit_miss[memory]", test_cache_hit_miss(_make_cache())),
+            ("cache_hit_miss[filesystem]", _run_fs_hit_miss(base_dir)),
+            ("cache_ttl_expiration", _run_ttl_test()),
+            ("cache_key_generation", test_cache_key_generation(_make_cache())),
+            ("cache_decorator", test_cache_decorator(_make_cache())),
+            ("cache_invalidation", test_cache_invalidation(_make_cache())),
+            ("cache_clear_all", test_cache_clear_all(_make_cache())),
+            ("cache_persistence_across_instances", _run_fs_persistence(base_dir)),
+        ]
+        results = await asyncio.gather(*(coro for _, coro in named), return_exceptions=True)
+
+    failed = False
+    for (name, _), result in zip(named, results):
+        if isinstance(result, AssertionError):
+            failed = True
+            print(f"\\n❌ Test failed ({name}): {result}")
+        elif isinstance(result, BaseException):
+            failed = True
+            print(f"\\n❌ Unexpected error ({name}): {result}")
+            import traceback
+            traceback.print_exception(result)
+    if failed:
         sys.exit(1)
 
+    print("\\n" + "=" * 80)
+    print("✅ All cache tests passed!")
+    print("=" * 80)
+
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    # uvloop roughly halves per-await overhead; drop-in when installed
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
 '''
+
+
+def generate_cache_tests() -> str:
+    """Generate comprehensive tests for cache middleware."""
+    return _CACHE_TESTS_SRC
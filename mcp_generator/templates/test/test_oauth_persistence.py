@@ -14,62 +14,73 @@ Tests cover:
 - Token deletion (logout/revocation)
 - RFC 7662 token introspection
 - Storage backend integration
+
+The tests are independent of each other; run them in parallel with
+pytest-xdist for faster suites:
+
+    pytest -n auto test_oauth_persistence_generated.py
 """
 
 import asyncio
+import os
 import sys
 import tempfile
 import time
 from datetime import datetime, timedelta
-from pathlib import Path
 
 import pytest
+import pytest_asyncio
 
-# Add parent directories to path for imports
-test_dir = Path(__file__).parent
-project_root = test_dir.parent.parent
-generated_mcp_dir = project_root / "generated_mcp"
+# Add generated_mcp to the import path. Plain os.path strings keep this
+# import-time block allocation-light - pytest imports the module once per
+# worker, so no Path objects are built unless the debug dump is on.
+_test_dir = os.path.dirname(os.path.abspath(__file__))
+_project_root = os.path.dirname(os.path.dirname(_test_dir))
+_generated_mcp_dir = os.path.join(_project_root, "generated_mcp")
 
 # Debug: Print paths for troubleshooting (only in CI or when debugging)
-import os
 if os.getenv("CI") or os.getenv("DEBUG_OAUTH_TESTS"):
     print(f"\\n[OAuth Tests Debug]")
-    print(f"  __file__: {Path(__file__).resolve()}")
-    print(f"  test_dir: {test_dir.resolve()}")
-    print(f"  project_root: {project_root.resolve()}")
-    print(f"  generated_mcp_dir: {generated_mcp_dir.resolve()}")
-    print(f"  storage.py exists: {(generated_mcp_dir / 'storage.py').exists()}")
-    print(f"  middleware/ exists: {(generated_mcp_dir / 'middleware').exists()}")
+    print(f"  __file__: {os.path.abspath(__file__)}")
+    print(f"  test_dir: {_test_dir}")
+    print(f"  project_root: {_project_root}")
+    print(f"  generated_mcp_dir: {_generated_mcp_dir}")
+    print(f"  storage.py exists: {os.path.exists(os.path.join(_generated_mcp_dir, 'storage.py'))}")
+    print(f"  middleware/ exists: {os.path.isdir(os.path.join(_generated_mcp_dir, 'middleware'))}")
     print(f"  sys.path[0]: {sys.path[0] if sys.path else 'empty'}")
 
-sys.path.insert(0, str(generated_mcp_dir))
+if _generated_mcp_dir not in sys.path:
+    sys.path.insert(0, _generated_mcp_dir)
 
 try:
-    from storage import get_storage
+    from storage import FilesystemStorage, get_storage
     from middleware.oauth_provider import OAuthTokenManager, get_token_manager
     STORAGE_AVAILABLE = True
 except ImportError as e:
+    # Don't fail during import - pytest needs to collect tests; the skipif
+    # markers below report the import error as the skip reason.
     STORAGE_AVAILABLE = False
     IMPORT_ERROR = str(e)
-    # Don't exit during import - pytest needs to collect tests
-    if __name__ == "__main__":
-        print("⚠️  Skipped: OAuth provider or storage modules not generated")
-        print(f"   Import error: {e}")
-        print(f"   Looked in: {generated_mcp_dir}")
-        print(f"   Storage exists: {(generated_mcp_dir / 'storage.py').exists()}")
-        print(f"   Middleware dir exists: {(generated_mcp_dir / 'middleware').exists()}")
-        print("   Run with: uv run generate-mcp --enable-storage")
-        sys.exit(0)
+
+
+@pytest_asyncio.fixture
+async def token_manager():
+    """Token manager over the shared in-memory storage backend.
+
+    get_storage() memoizes the backend, so every test works against the
+    same storage instance; tests stay isolated by using distinct client
+    IDs. Tests that need a different backend (filesystem, no storage)
+    build their own manager instead.
+    """
+    storage = get_storage("memory")
+    yield get_token_manager(storage)
 
 
 @pytest.mark.skipif(not STORAGE_AVAILABLE, reason=f"Storage not generated: {IMPORT_ERROR if not STORAGE_AVAILABLE else 'N/A'}")
-async def test_token_storage_and_retrieval():
+async def test_token_storage_and_retrieval(token_manager):
     """Test basic token storage and retrieval."""
     print("\\n🧪 Testing Token Storage and Retrieval...")
 
-    storage = get_storage("memory")
-    token_manager = get_token_manager(storage)
-
     client_id = "test_client_123"
     token_data = {
         "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
@@ -97,13 +108,10 @@ async def test_token_storage_and_retrieval():
 
 
 @pytest.mark.skipif(not STORAGE_AVAILABLE, reason="Storage not generated")
-async def test_token_deletion():
+async def test_token_deletion(token_manager):
     """Test token deletion (logout/revocation)."""
     print("\\n🧪 Testing Token Deletion...")
 
-    storage = get_storage("memory")
-    token_manager = get_token_manager(storage)
-
     client_id = "delete_test_client"
     token_data = {
         "access_token": "token_to_delete",
@@ -128,28 +136,25 @@ async def test_token_deletion():
 
 
 @pytest.mark.skipif(not STORAGE_AVAILABLE, reason="Storage not generated")
-async def test_multiple_client_tokens():
+async def test_multiple_client_tokens(token_manager):
     """Test storing tokens for multiple clients."""
     print("\\n🧪 Testing Multiple Client Tokens...")
 
-    storage = get_storage("memory")
-    token_manager = get_token_manager(storage)
-
-    clients = {
-        "client_A": {"access_token": "token_A", "user_id": "user_1"},
-        "client_B": {"access_token": "token_B", "user_id": "user_2"},
-        "client_C": {"access_token": "token_C", "user_id": "user_3"},
-    }
+    clients = [
+        ("client_A", {"access_token": "token_A"}, "user_1"),
+        ("client_B", {"access_token": "token_B"}, "user_2"),
+        ("client_C", {"access_token": "token_C"}, "user_3"),
+    ]
 
-    # Store all tokens
-    for client_id, token_data in clients.items():
-        user_id = token_data.pop("user_id")
-        await token_manager.store_token(client_id, token_data, user_id=user_id)
+    # Store all tokens concurrently (user-specific, so store_token per client)
+    await asyncio.gather(
+        *(token_manager.store_token(cid, td, user_id=uid) for cid, td, uid in clients)
+    )
     print("   ✅ Stored tokens for 3 clients")
 
-    # Retrieve and verify each
-    for client_id, expected in clients.items():
-        retrieved = await token_manager.get_token(client_id)
+    # Retrieve and verify each through one batched call
+    tokens = await token_manager.get_tokens([cid for cid, _td, _uid in clients])
+    for (client_id, expected, _uid), retrieved in zip(clients, tokens):
         assert retrieved is not None, f"❌ Failed to retrieve token for {client_id}"
         assert retrieved["access_token"] == expected["access_token"], f"❌ Token mismatch for {client_id}"
     print("   ✅ All client tokens retrievable independently")
@@ -171,7 +176,7 @@ async def test_token_persistence_across_instances():
 
     with tempfile.TemporaryDirectory() as tmpdir:
         # First instance
-        storage1 = get_storage("filesystem", base_dir=tmpdir)
+        storage1 = get_storage("filesystem", storage_dir=tmpdir)
         token_manager1 = get_token_manager(storage1)
 
         client_id = "persistent_client"
@@ -184,8 +189,10 @@ async def test_token_persistence_across_instances():
         await token_manager1.store_token(client_id, token_data)
         print("   ✅ Token stored in first instance")
 
-        # Second instance (simulates server restart)
-        storage2 = get_storage("filesystem", base_dir=tmpdir)
+        # Second instance (simulates server restart). Constructed directly:
+        # get_storage caches per configuration and would hand back the
+        # first instance, making the restart check vacuous.
+        storage2 = FilesystemStorage(storage_dir=tmpdir)
         token_manager2 = get_token_manager(storage2)
 
         retrieved = await token_manager2.get_token(client_id)
@@ -224,13 +231,10 @@ async def test_token_manager_without_storage():
 
 
 @pytest.mark.skipif(not STORAGE_AVAILABLE, reason="Storage not generated")
-async def test_token_with_metadata():
+async def test_token_with_metadata(token_manager):
     """Test that token metadata is properly stored and retrieved."""
     print("\\n🧪 Testing Token Metadata...")
 
-    storage = get_storage("memory")
-    token_manager = get_token_manager(storage)
-
     client_id = "metadata_client"
     token_data = {
         "access_token": "access_with_metadata",
@@ -263,64 +267,22 @@ async def test_token_with_metadata():
 
 
 @pytest.mark.skipif(not STORAGE_AVAILABLE, reason="Storage not generated")
-async def test_concurrent_token_operations():
+async def test_concurrent_token_operations(token_manager):
     """Test concurrent token storage and retrieval."""
     print("\\n🧪 Testing Concurrent Token Operations...")
 
-    storage = get_storage("memory")
-    token_manager = get_token_manager(storage)
-
-    # Store tokens concurrently
-    async def store_token(client_num: int):
-        client_id = f"concurrent_client_{client_num}"
-        token_data = {"access_token": f"token_{client_num}"}
-        await token_manager.store_token(client_id, token_data)
-
-    # Store 10 tokens concurrently
-    await asyncio.gather(*[store_token(i) for i in range(10)])
+    # Store 10 tokens through one batched call
+    results = await token_manager.store_tokens(
+        [(f"concurrent_client_{i}", {"access_token": f"token_{i}"}) for i in range(10)]
+    )
+    assert all(results), "❌ Batch store reported failures"
     print("   ✅ Stored 10 tokens concurrently")
 
-    # Retrieve tokens concurrently
-    async def retrieve_token(client_num: int):
-        client_id = f"concurrent_client_{client_num}"
-        token = await token_manager.get_token(client_id)
+    # Retrieve them through one batched call
+    tokens = await token_manager.get_tokens([f"concurrent_client_{i}" for i in range(10)])
+    for client_num, token in enumerate(tokens):
         assert token is not None, f"❌ Failed to retrieve token for client {client_num}"
         assert token["access_token"] == f"token_{client_num}", f"❌ Token mismatch for client {client_num}"
-
-    await asyncio.gather(*[retrieve_token(i) for i in range(10)])
     print("   ✅ Retrieved all 10 tokens concurrently")
     print("   ✅ No race conditions detected")
-
-
-async def main():
-    """Run all OAuth persistence tests."""
-    print("=" * 80)
-    print("OAuth Token Persistence Test Suite")
-    print("=" * 80)
-
-    try:
-        await test_token_storage_and_retrieval()
-        await test_token_deletion()
-        await test_multiple_client_tokens()
-        await test_token_persistence_across_instances()
-        await test_token_manager_without_storage()
-        await test_token_with_metadata()
-        await test_concurrent_token_operations()
-
-        print("\\n" + "=" * 80)
-        print("✅ All OAuth persistence tests passed!")
-        print("=" * 80)
-
-    except AssertionError as e:
-        print(f"\\n❌ Test failed: {e}")
-        sys.exit(1)
-    except Exception as e:
-        print(f"\\n❌ Unexpected error: {e}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
-
-
-if __name__ == "__main__":
-    asyncio.run(main())
 '''
@@ -59,7 +59,8 @@ def test_no_resources_generated():
     server_name = re.sub(r"_+", "_", server_name).strip("_")
 
     # Build the base test code
-    code = f'''"""
+    sections = [
+        f'''"""
 Generated Resource Tests for {api_metadata.title}
 
 Validates MCP resource templates using RFC 6570 URI syntax.
@@ -74,7 +75,9 @@ from pathlib import Path
 
 # Add the generated_mcp directory to the path to import the server
 generated_mcp_dir = Path(__file__).parent.parent.parent / "generated_mcp"
-sys.path.insert(0, str(generated_mcp_dir.absolute()))
+_generated_mcp_path = str(generated_mcp_dir.absolute())
+if _generated_mcp_path not in sys.path:
+    sys.path.insert(0, _generated_mcp_path)
 
 # Import FastMCP Client for proper MCP communication
 try:
@@ -204,10 +207,11 @@ class TestResourceURITemplates:
                 print(f"    - Has wildcard parameter")
 
 '''
+    ]
 
     # Add module-specific test classes
     for module_name, resource_count in sorted(resources_by_module.items()):
-        code += f'''
+        sections.append(f'''
 class Test{module_name}Resources:
     """Test resources from {module_name} module."""
 
@@ -223,10 +227,10 @@ class Test{module_name}Resources:
             f"Expected at least {resource_count} templates, got {{len(templates)}}"
         )
 
-'''
+''')
 
     # Add summary comment
-    code += f"""
+    sections.append(f"""
 # ============================================================================
 # Test Summary
 # ============================================================================
@@ -235,11 +239,11 @@ class Test{module_name}Resources:
 # Modules with Resources: {len(resources_by_module)}
 #
 # Resource Distribution:
-"""
+""")
     for module_name, count in sorted(resources_by_module.items()):
-        code += f"#   - {module_name}: {count} resource(s)\n"
+        sections.append(f"#   - {module_name}: {count} resource(s)\n")
 
-    code += """#
+    sections.append("""#
 # Run these tests with:
 #   pytest test_resources_generated.py -v
 #
@@ -253,6 +257,6 @@ class Test{module_name}Resources:
 #   - FastMCPTransport provides direct access to the MCP server
 #
 # ============================================================================
-"""
+""")
 
-    return code
+    return "".join(sections)
@@ -22,6 +22,44 @@ from .templates.test.test_oauth_persistence import (
 from .templates.test.test_resources import generate_resource_tests as _generate_resources
 from .templates.test.test_tools import generate_tool_tests as _generate_tools
 
+try:  # optional fast JSON parser for multi-MB specs
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Parsed specs keyed by (path, mtime); every test generator calls
+# _load_openapi_spec, so one generation run would otherwise re-read and
+# re-parse the same file per generated test module.
+_SPEC_CACHE: dict[tuple[str, float], dict] = {}
+
+
+def _parse_openapi_file(openapi_path: Path) -> dict | None:
+    """Parse a spec file, dispatching on extension; None if nothing parses.
+
+    The file is read once; .yaml/.yml files go straight to the YAML parser
+    instead of paying a doomed JSON parse attempt first.
+    """
+    try:
+        raw = openapi_path.read_bytes()
+    except OSError:
+        return None
+
+    if openapi_path.suffix == ".json":
+        try:
+            return _json_loads(raw)
+        except ValueError:  # covers json and orjson decode errors
+            pass  # some specs ship YAML in a .json file; fall through
+
+    try:
+        import yaml
+
+        return yaml.safe_load(raw)
+    except Exception:
+        return None
+
 
 def _load_openapi_spec() -> dict:
     """Load the OpenAPI specification from openapi.json or openapi.yaml."""
@@ -32,44 +70,53 @@ def _load_openapi_spec() -> dict:
         for filename in ["openapi.json", "openapi.yaml", "openapi.yml"]:
             openapi_path = search_dir / filename
             if openapi_path.exists():
-                try:
-                    with open(openapi_path, encoding="utf-8") as f:
-                        # Try JSON first
-                        return json.load(f)
-                except json.JSONDecodeError:
-                    # Try YAML
-                    try:
-                        import yaml
-
-                        with open(openapi_path, encoding="utf-8") as f:
-                            return yaml.safe_load(f)
-                    except Exception:
-                        pass
+                cache_key = (str(openapi_path), openapi_path.stat().st_mtime)
+                spec = _SPEC_CACHE.get(cache_key)
+                if spec is None:
+                    spec = _parse_openapi_file(openapi_path)
+                    if spec is None:
+                        continue
+                    _SPEC_CACHE[cache_key] = spec
+                return spec
 
     raise FileNotFoundError(
         f"OpenAPI spec not found in current working directory or at {Path(__file__).parent.parent / 'openapi.json'} or openapi.yaml"
     )
 
 
-def _extract_oauth_flows_from_spec(openapi_spec: dict) -> set[str]:
+# Extraction results keyed by id() of the spec dict: dicts are unhashable,
+# and the specs passed in come from _SPEC_CACHE above, which keeps them
+# alive so their ids stay stable for the whole generation run.
+_FLOWS_CACHE: dict[int, frozenset[str]] = {}
+_CLIENT_EXAMPLES_CACHE: dict[int, list[dict[str, str]]] = {}
+
+
+def _extract_oauth_flows_from_spec(openapi_spec: dict) -> frozenset[str]:
     """
     Extract available OAuth2 flows from OpenAPI spec.
 
     Returns:
-        Set of flow names: 'clientCredentials', 'authorizationCode', 'password', 'implicit'
+        Frozen set of flow names: 'clientCredentials', 'authorizationCode', 'password',
+        'implicit'. Consumers only do membership checks, and the immutable
+        result is safe to hand out from the cache.
     """
-    flows = set()
+    cache_key = id(openapi_spec)
+    cached = _FLOWS_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
 
-    if "components" not in openapi_spec or "securitySchemes" not in openapi_spec["components"]:
-        return flows
+    flows = set()
 
-    for _scheme_name, scheme in openapi_spec["components"]["securitySchemes"].items():
-        if scheme.get("type") == "oauth2" and "flows" in scheme:
-            for flow_name in scheme["flows"].keys():
-                # Convert to camelCase for consistency
-                flows.add(flow_name)
+    if "components" in openapi_spec and "securitySchemes" in openapi_spec["components"]:
+        for _scheme_name, scheme in openapi_spec["components"]["securitySchemes"].items():
+            if scheme.get("type") == "oauth2" and "flows" in scheme:
+                for flow_name in scheme["flows"].keys():
+                    # Convert to camelCase for consistency
+                    flows.add(flow_name)
 
-    return flows
+    frozen = frozenset(flows)
+    _FLOWS_CACHE[cache_key] = frozen
+    return frozen
 
 
 def _extract_client_examples_from_spec(openapi_spec: dict) -> list[dict[str, str]]:
@@ -82,6 +129,11 @@ def _extract_client_examples_from_spec(openapi_spec: dict) -> list[dict[str, str
     Returns:
         List of dicts with 'client_id', 'client_secret', 'description'
     """
+    cache_key = id(openapi_spec)
+    cached = _CLIENT_EXAMPLES_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
     clients = []
 
     # Check for custom extension with client examples
@@ -107,6 +159,7 @@ def _extract_client_examples_from_spec(openapi_spec: dict) -> list[dict[str, str
             }
         )
 
+    _CLIENT_EXAMPLES_CACHE[cache_key] = clients
     return clients
 
 
@@ -130,7 +183,7 @@ def generate_auth_flow_tests(
         available_flows = _extract_oauth_flows_from_spec(openapi_spec)
     except Exception as e:
         print(f"Warning: Could not load OpenAPI spec: {e}")
-        available_flows = set()
+        available_flows = frozenset()
 
     # Use template to generate test code
     return _generate_auth_flows(api_metadata, security_config, modules, available_flows)
@@ -7,10 +7,38 @@ and parameter description formatting.
 
 import json
 import re
+from functools import lru_cache
 from typing import Any, get_origin, get_type_hints
 
 from .config import MAX_TOOL_NAME_LENGTH, TOOL_NAME_ABBREVIATIONS, TOOL_NAME_OVERRIDES
 
+# Compiled once at import; these run once per operation during generation, so
+# skipping the re-module cache lookup per call matters on large specs.
+_PRERELEASE_RE = re.compile(r"^(\d+\.\d+\.\d+)-([a-z]+)\.(.+)$")
+_VERB_RE = re.compile(r"^(get|post|put|delete|patch)_(.+)$")
+_CAMEL_RE = re.compile(r"([a-z0-9])([A-Z])")
+
+# PEP 440 spellings for prerelease identifiers; anything else falls back to
+# its first letter.
+_PRERELEASE_MAP = {
+    "alpha": "a",
+    "beta": "b",
+    "rc": "rc",
+    "dev": "dev",
+}
+
+# Characters that trigger an underscore before a following uppercase letter
+# (mirrors _CAMEL_RE's left-hand character class).
+_LOWER_OR_DIGIT = frozenset("abcdefghijklmnopqrstuvwxyz0123456789")
+
+# Example values for required string fields, matched against the lowered
+# field name in order (first hit wins, so "username" fields match "name").
+_FIELD_NAME_EXAMPLES = {
+    "email": "user@example.com",
+    "name": "Example Name",
+    "username": "username",
+}
+
 
 def normalize_version(version: str) -> str:
     """
@@ -26,27 +54,19 @@ def normalize_version(version: str) -> str:
     # Convert: X.Y.Z-beta.A.B -> X.Y.Zb0+A.B
 
     # Match version-prerelease.rest pattern
-    match = re.match(r"^(\d+\.\d+\.\d+)-([a-z]+)\.(.+)$", version)
-    if match:
-        base_version, prerelease, local = match.groups()
-
-        # Map prerelease identifiers to PEP 440 format
-        prerelease_map = {
-            "alpha": "a",
-            "beta": "b",
-            "rc": "rc",
-            "dev": "dev",
-        }
-
-        prerelease_short = prerelease_map.get(prerelease, prerelease[:1])
+    match = _PRERELEASE_RE.match(version)
+    if not match:
+        # No match: return as-is (already valid or will fail validation)
+        return version
 
-        # PEP 440 format: base_version + prerelease_short + 0 + '+' + local
-        return f"{base_version}{prerelease_short}0+{local}"
+    base_version, prerelease, local = match.groups()
+    prerelease_short = _PRERELEASE_MAP.get(prerelease, prerelease[:1])
 
-    # If no match, return as-is (already valid or will fail validation)
-    return version
+    # PEP 440 format: base_version + prerelease_short + 0 + '+' + local
+    return f"{base_version}{prerelease_short}0+{local}"
 
 
+@lru_cache(maxsize=4096)
 def sanitize_name(name: str) -> str:
     """
     Convert API method name to MCP tool name.
@@ -76,7 +96,7 @@ def sanitize_name(name: str) -> str:
     }
 
     # Extract HTTP verb prefix if present
-    match = re.match(r"^(get|post|put|delete|patch)_(.+)$", name)
+    match = _VERB_RE.match(name)
     if match:
         verb, rest = match.groups()
 
@@ -95,12 +115,15 @@ def sanitize_name(name: str) -> str:
         name = f"{semantic_verb}_{rest}"
 
     # Convert camelCase to snake_case
-    name = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", name)
+    name = _CAMEL_RE.sub(r"\1_\2", name)
     name = name.lower()
 
     # 3. Apply abbreviations if name is too long
     if len(name) > MAX_TOOL_NAME_LENGTH:
         for long_form, short_form in TOOL_NAME_ABBREVIATIONS.items():
+            # Membership test is a cheap scan; replace() allocates regardless
+            if long_form not in name:
+                continue
             name = name.replace(long_form, short_form)
             # Stop early if we're under the limit
             if len(name) <= MAX_TOOL_NAME_LENGTH:
@@ -109,10 +132,22 @@ def sanitize_name(name: str) -> str:
     return name
 
 
+@lru_cache(maxsize=4096)
 def camel_to_snake(name: str) -> str:
-    """Convert CamelCase to snake_case."""
-    name = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", name)
-    return name.lower()
+    """Convert CamelCase to snake_case.
+
+    Identifiers here are short (tens of chars), where a direct character
+    scan beats spinning up the regex engine; output matches _CAMEL_RE's
+    substitution exactly.
+    """
+    out = []
+    prev = ""
+    for ch in name:
+        if "A" <= ch <= "Z" and prev in _LOWER_OR_DIGIT:
+            out.append("_")
+        out.append(ch)
+        prev = ch
+    return "".join(out).lower()
 
 
 def get_pydantic_model_schema(model_class) -> dict[str, Any] | None:
@@ -126,33 +161,36 @@ def get_pydantic_model_schema(model_class) -> dict[str, Any] | None:
 
         # Extract field information
         for field_name, field_info in model_class.model_fields.items():
-            field_schema = {
-                "type": str(field_info.annotation),
-                "description": field_info.description or "",
-                "required": field_info.is_required(),
-                "alias": field_info.alias or field_name,
+            # Computed once per field; the branches below reuse them.
+            ann_str = str(field_info.annotation)
+            ann_lower = ann_str.lower()
+            alias_or_name = field_info.alias or field_name
+            required = field_info.is_required()
+            description = field_info.description or ""
+
+            schema["fields"][field_name] = {
+                "type": ann_str,
+                "description": description,
+                "required": required,
+                "alias": alias_or_name,
             }
 
-            schema["fields"][field_name] = field_schema
-
-            if field_info.is_required():
+            if required:
                 schema["required"].append(field_name)
 
-            # Build example value
-            if field_info.is_required():
-                if "str" in str(field_info.annotation).lower():
-                    if "email" in field_name.lower():
-                        schema["example"][field_info.alias or field_name] = "user@example.com"
-                    elif "name" in field_name.lower():
-                        schema["example"][field_info.alias or field_name] = "Example Name"
-                    elif "username" in field_name.lower():
-                        schema["example"][field_info.alias or field_name] = "username"
+                # Build example value
+                if "str" in ann_lower:
+                    fname_lower = field_name.lower()
+                    for hint, example in _FIELD_NAME_EXAMPLES.items():
+                        if hint in fname_lower:
+                            schema["example"][alias_or_name] = example
+                            break
                     else:
-                        schema["example"][field_info.alias or field_name] = f"<{field_name}>"
-                elif "bool" in str(field_info.annotation).lower():
-                    schema["example"][field_info.alias or field_name] = False
-                elif "int" in str(field_info.annotation).lower():
-                    schema["example"][field_info.alias or field_name] = 0
+                        schema["example"][alias_or_name] = f"<{field_name}>"
+                elif "bool" in ann_lower:
+                    schema["example"][alias_or_name] = False
+                elif "int" in ann_lower:
+                    schema["example"][alias_or_name] = 0
 
         return schema
     except Exception:
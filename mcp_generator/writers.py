@@ -5,21 +5,61 @@ Handles writing generated code to the filesystem, creating directories,
 and managing package initialization files.
 """
 
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from .models import ModuleSpec
+from .templates.test.conftest_template import generate_test_conftest
+
+# Server-name cleanup patterns (same logic as cli.py): strip version
+# suffixes from the API title, then collapse repeated underscores.
+_VERSION_RE = re.compile(r"\s+v?\d+\.\d+(\.\d+)?", re.IGNORECASE)
+_UNDERSCORE_RE = re.compile(r"_+")
+
+# Writes release the GIL, so a small pool overlaps flush/metadata latency
+# across the batch; more workers than this just queue on the disk.
+_MAX_WRITE_WORKERS = 8
+
+
+def _write_one(file: tuple[Path, str]) -> None:
+    path, content = file
+    path.write_bytes(content.encode("utf-8"))
+
+
+def _batch_write(files: list[tuple[Path, str]]) -> None:
+    """Write a batch of (path, content) files collected by a writer.
+
+    Writers queue everything they emit and submit the whole batch here in
+    one place instead of interleaving rendering with open/write/close
+    cycles, keeping the I/O together and in one spot to optimize.
+
+    Content is encoded up front and written via write_bytes: one encode
+    and one write syscall per file, with no TextIOWrapper layered between.
+    The files are independent, so batches go through a thread pool and
+    overlap their I/O; the success log stays in queue order.
+    """
+    if not files:
+        return
+    if len(files) == 1:
+        _write_one(files[0])
+    else:
+        with ThreadPoolExecutor(max_workers=min(_MAX_WRITE_WORKERS, len(files))) as executor:
+            # list() drains the iterator so worker exceptions surface here
+            list(executor.map(_write_one, files))
+    for path, _content in files:
+        print(f"   ✅ {path.name}")
 
 
 def write_server_modules(modules: dict[str, ModuleSpec], output_dir: Path) -> None:
     """Write server modules to the filesystem."""
     output_dir.mkdir(exist_ok=True, parents=True)
 
-    # Write each server module
+    files: list[tuple[Path, str]] = []
+
+    # Queue each server module
     for module_spec in modules.values():
-        output_file = output_dir / module_spec.filename
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(module_spec.code)
-        print(f"   ✅ {module_spec.filename}")
+        files.append((output_dir / module_spec.filename, module_spec.code))
 
     # Generate __init__.py for servers package
     imports = []
@@ -31,16 +71,18 @@ def write_server_modules(modules: dict[str, ModuleSpec], output_dir: Path) -> No
         imports.append(f"from .{module_name} import mcp as {server_var}")
         exports.append(f'    "{server_var}",')
 
-    init_content = '"""Servers package for modular MCP servers."""\n'
-    init_content += "\n".join(imports) + "\n\n"
-    init_content += "__all__ = [\n"
-    init_content += "\n".join(exports) + "\n"
-    init_content += "]\n"
+    init_content = "".join(
+        [
+            '"""Servers package for modular MCP servers."""\n',
+            "\n".join(imports),
+            "\n\n__all__ = [\n",
+            "\n".join(exports),
+            "\n]\n",
+        ]
+    )
 
-    init_file = output_dir / "__init__.py"
-    with open(init_file, "w", encoding="utf-8") as f:
-        f.write(init_content)
-    print("   ✅ __init__.py")
+    files.append((output_dir / "__init__.py", init_content))
+    _batch_write(files)
 
 
 def write_middleware_files(
@@ -49,51 +91,40 @@ def write_middleware_files(
     """Write middleware files to the filesystem."""
     output_dir.mkdir(exist_ok=True, parents=True)
 
-    # Write authentication middleware
-    auth_file = output_dir / "authentication.py"
-    with open(auth_file, "w", encoding="utf-8") as f:
-        f.write(middleware_code)
-    print("   ✅ authentication.py")
-
-    # Write OAuth provider
-    oauth_file = output_dir / "oauth_provider.py"
-    with open(oauth_file, "w", encoding="utf-8") as f:
-        f.write(oauth_code)
-    print("   ✅ oauth_provider.py")
-
-    # Write event store
-    event_store_file = output_dir / "event_store.py"
-    with open(event_store_file, "w", encoding="utf-8") as f:
-        f.write(event_store_code)
-    print("   ✅ event_store.py")
-
-    # Create __init__.py for middleware package
-    init_file = output_dir / "__init__.py"
-    with open(init_file, "w", encoding="utf-8") as f:
-        f.write('"""Middleware package for MCP server."""\n')
-        f.write(
-            "from .authentication import ApiClientContextMiddleware, JWTAuthenticationBackend, AuthenticatedIdentity\n"
-        )
-        f.write(
-            "from .oauth_provider import build_authentication_stack, create_remote_auth_provider, create_jwt_verifier, RequireScopesMiddleware\n"
-        )
-        f.write("from .event_store import InMemoryEventStore\n")
-        f.write("\n__all__ = [\n")
-        f.write('    "ApiClientContextMiddleware",\n')
-        f.write('    "JWTAuthenticationBackend",\n')
-        f.write('    "AuthenticatedIdentity",\n')
-        f.write('    "build_authentication_stack",\n')
-        f.write('    "create_remote_auth_provider",\n')
-        f.write('    "create_jwt_verifier",\n')
-        f.write('    "RequireScopesMiddleware",\n')
-        f.write('    "InMemoryEventStore",\n')
-        f.write("]\n")
+    # __init__.py for the middleware package, assembled as one string so it
+    # lands in the batch like the rendered modules
+    init_content = "".join(
+        [
+            '"""Middleware package for MCP server."""\n',
+            "from .authentication import ApiClientContextMiddleware, JWTAuthenticationBackend, AuthenticatedIdentity\n",
+            "from .oauth_provider import build_authentication_stack, create_remote_auth_provider, create_jwt_verifier, RequireScopesMiddleware\n",
+            "from .event_store import InMemoryEventStore\n",
+            "\n__all__ = [\n",
+            '    "ApiClientContextMiddleware",\n',
+            '    "JWTAuthenticationBackend",\n',
+            '    "AuthenticatedIdentity",\n',
+            '    "build_authentication_stack",\n',
+            '    "create_remote_auth_provider",\n',
+            '    "create_jwt_verifier",\n',
+            '    "RequireScopesMiddleware",\n',
+            '    "InMemoryEventStore",\n',
+            "]\n",
+        ]
+    )
+
+    _batch_write(
+        [
+            (output_dir / "authentication.py", middleware_code),
+            (output_dir / "oauth_provider.py", oauth_code),
+            (output_dir / "event_store.py", event_store_code),
+            (output_dir / "__init__.py", init_content),
+        ]
+    )
 
 
 def write_main_server(code: str, output_file: Path) -> None:
     """Write main composition server to filesystem."""
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.write(code)
+    output_file.write_bytes(code.encode("utf-8"))
     print(f"✅ Generated main server: {output_file}")
 
 
@@ -107,8 +138,6 @@ def write_package_files(
 ) -> None:
     """Write package metadata files (README, pyproject.toml, __init__.py)."""
 
-    import re
-
     # Generate README.md
     oauth_flows = (
         ", ".join(security_config.oauth_config.flows.keys())
@@ -116,10 +145,10 @@ def write_package_files(
         else "None"
     )
     # Use same cleaning logic as in cli.py - remove version patterns from title
-    clean_title = re.sub(r"\s+v?\d+\.\d+(\.\d+)?", "", api_metadata.title, flags=re.IGNORECASE)
+    clean_title = _VERSION_RE.sub("", api_metadata.title)
     server_name = clean_title.lower().replace(" ", "_").replace("-", "_").replace(".", "_")
     # Remove multiple consecutive underscores
-    server_name = re.sub(r"_+", "_", server_name).strip("_")
+    server_name = _UNDERSCORE_RE.sub("_", server_name).strip("_")
 
     # Build header with optional icon
     header = f"# {api_metadata.title} - MCP Server\n\n"
@@ -129,7 +158,9 @@ def write_package_files(
         header = f"# {api_metadata.title} - MCP Server\n\n"
         header += f'<img src="{api_metadata.icon_url}" alt="API Logo" height="64">\n\n'
 
-    readme_content = (
+    # Assemble the README as a list of parts and join once at the end;
+    # repeated += on a string this size copies the whole document each time
+    readme_parts = [
         header
         + f"""Auto-generated Model Context Protocol (MCP) server for {api_metadata.title}.
 
@@ -151,13 +182,15 @@ to interact with the {api_metadata.title} API through the Model Context Protocol
 ## Generated Modules
 
 """
-    )
+    ]
 
-    for module_spec in modules.values():
-        module_name = module_spec.api_var_name.replace("_api", "")
-        readme_content += f"- **{module_name}** - {module_spec.tool_count} tools\n"
+    readme_parts.extend(
+        f"- **{module_spec.api_var_name.replace('_api', '')}** - {module_spec.tool_count} tools\n"
+        for module_spec in modules.values()
+    )
 
-    readme_content += f"""
+    readme_parts.append(
+        f"""
 ## Installation
 
 ### Option 1: Using fastmcp.json (Recommended)
@@ -379,20 +412,18 @@ See the FastMCP docs for more options: https://docs.fastmcp.com/servers/middlewa
 
 - **Backend URL:** {api_metadata.backend_url}
 """
+    )
 
     if api_metadata.external_docs and api_metadata.external_docs.get("url"):
-        readme_content += f"- **Documentation:** {api_metadata.external_docs['url']}\n"
+        readme_parts.append(f"- **Documentation:** {api_metadata.external_docs['url']}\n")
 
     if api_metadata.contact and api_metadata.contact.get("email"):
-        readme_content += f"- **Contact:** {api_metadata.contact['email']}\n"
+        readme_parts.append(f"- **Contact:** {api_metadata.contact['email']}\n")
 
     if api_metadata.license and api_metadata.license.get("name"):
-        readme_content += f"\n## License\n\n{api_metadata.license['name']}\n"
+        readme_parts.append(f"\n## License\n\n{api_metadata.license['name']}\n")
 
-    readme_file = output_dir / "README.md"
-    with open(readme_file, "w", encoding="utf-8") as f:
-        f.write(readme_content)
-    print("   ✅ README.md")
+    files: list[tuple[Path, str]] = [(output_dir / "README.md", "".join(readme_parts))]
 
     # --- Use template for pyproject.toml ---
     from .renderers import render_pyproject_template
@@ -404,10 +435,7 @@ See the FastMCP docs for more options: https://docs.fastmcp.com/servers/middlewa
         total_tools=total_tools,
         enable_storage=enable_storage,
     )
-    pyproject_file = output_dir / "pyproject.toml"
-    with open(pyproject_file, "w", encoding="utf-8") as f:
-        f.write(pyproject_content)
-    print("   ✅ pyproject.toml")
+    files.append((output_dir / "pyproject.toml", pyproject_content))
 
     # --- Use template for fastmcp.json ---
     from .renderers import render_fastmcp_template
@@ -419,10 +447,7 @@ See the FastMCP docs for more options: https://docs.fastmcp.com/servers/middlewa
         total_tools=total_tools,
         server_name=server_name,
     )
-    fastmcp_file = output_dir / "fastmcp.json"
-    with open(fastmcp_file, "w", encoding="utf-8") as f:
-        f.write(fastmcp_content)
-    print("   ✅ fastmcp.json")
+    files.append((output_dir / "fastmcp.json", fastmcp_content))
 
     # Generate top-level __init__.py
     init_content = f'''"""
@@ -437,10 +462,7 @@ DO NOT EDIT MANUALLY - regenerate using: python -m mcp_generator
 __version__ = "{api_metadata.version}"
 '''
 
-    init_file = output_dir / "__init__.py"
-    with open(init_file, "w", encoding="utf-8") as f:
-        f.write(init_content)
-    print("   ✅ __init__.py")
+    files.append((output_dir / "__init__.py", init_content))
 
     # Generate Docker files
     from .templates.dockerfile_template import (
@@ -449,25 +471,13 @@ __version__ = "{api_metadata.version}"
         generate_dockerignore,
     )
 
-    dockerfile_content = generate_dockerfile(api_metadata, server_name)
-    dockerfile = output_dir / "Dockerfile"
-    with open(dockerfile, "w", encoding="utf-8") as f:
-        f.write(dockerfile_content)
-    print("   ✅ Dockerfile")
-
-    # Generate docker-compose.yml
-    docker_compose_content = generate_docker_compose(api_metadata, server_name)
-    docker_compose_file = output_dir / "docker-compose.yml"
-    with open(docker_compose_file, "w", encoding="utf-8") as f:
-        f.write(docker_compose_content)
-    print("   ✅ docker-compose.yml")
+    files.append((output_dir / "Dockerfile", generate_dockerfile(api_metadata, server_name)))
+    files.append(
+        (output_dir / "docker-compose.yml", generate_docker_compose(api_metadata, server_name))
+    )
+    files.append((output_dir / ".dockerignore", generate_dockerignore()))
 
-    # Generate .dockerignore
-    dockerignore_content = generate_dockerignore()
-    dockerignore_file = output_dir / ".dockerignore"
-    with open(dockerignore_file, "w", encoding="utf-8") as f:
-        f.write(dockerignore_content)
-    print("   ✅ .dockerignore")
+    _batch_write(files)
 
 
 def write_test_files(
@@ -497,60 +507,39 @@ def write_test_files(
     """
     test_dir.mkdir(parents=True, exist_ok=True)
 
-    # Write auth flow tests (only if auth is configured)
+    # Shared conftest always ships (sys.path setup runs once per pytest
+    # session instead of once per collected test module); the suites are
+    # queued when their generator produced code
+    files: list[tuple[Path, str]] = [(test_dir / "conftest.py", generate_test_conftest())]
+
     if auth_test_code:
-        auth_test_file = test_dir / "test_auth_flows_generated.py"
-        with open(auth_test_file, "w", encoding="utf-8") as f:
-            f.write(auth_test_code)
-        print("   ✅ test_auth_flows_generated.py")
-
-    # Write tool tests
-    tool_test_file = test_dir / "test_tools_generated.py"
-    with open(tool_test_file, "w", encoding="utf-8") as f:
-        f.write(tool_test_code)
-    print("   ✅ test_tools_generated.py")
-
-    # Write OpenAPI feature tests
+        files.append((test_dir / "test_auth_flows_generated.py", auth_test_code))
+
+    files.append((test_dir / "test_tools_generated.py", tool_test_code))
+
     if openapi_feature_test_code:
-        feature_test_file = test_dir / "test_e2e_openapi_features_generated.py"
-        with open(feature_test_file, "w", encoding="utf-8") as f:
-            f.write(openapi_feature_test_code)
-        print("   ✅ test_e2e_openapi_features_generated.py")
+        files.append(
+            (test_dir / "test_e2e_openapi_features_generated.py", openapi_feature_test_code)
+        )
 
-    # Write HTTP basic E2E tests
     if http_basic_test_code:
-        http_basic_file = test_dir / "test_e2e_http_basic_generated.py"
-        with open(http_basic_file, "w", encoding="utf-8") as f:
-            f.write(http_basic_test_code)
-        print("   ✅ test_e2e_http_basic_generated.py")
+        files.append((test_dir / "test_e2e_http_basic_generated.py", http_basic_test_code))
 
-    # Write performance tests
     if performance_test_code:
-        performance_file = test_dir / "test_e2e_performance_generated.py"
-        with open(performance_file, "w", encoding="utf-8") as f:
-            f.write(performance_test_code)
-        print("   ✅ test_e2e_performance_generated.py")
+        files.append((test_dir / "test_e2e_performance_generated.py", performance_test_code))
 
-    # Write cache tests
     if cache_test_code:
-        cache_file = test_dir / "test_cache_generated.py"
-        with open(cache_file, "w", encoding="utf-8") as f:
-            f.write(cache_test_code)
-        print("   ✅ test_cache_generated.py")
+        files.append((test_dir / "test_cache_generated.py", cache_test_code))
 
-    # Write OAuth persistence tests
     if oauth_persistence_test_code:
-        oauth_file = test_dir / "test_oauth_persistence_generated.py"
-        with open(oauth_file, "w", encoding="utf-8") as f:
-            f.write(oauth_persistence_test_code)
-        print("   ✅ test_oauth_persistence_generated.py")
+        files.append(
+            (test_dir / "test_oauth_persistence_generated.py", oauth_persistence_test_code)
+        )
 
-    # Write resource tests
     if resource_test_code:
-        resource_file = test_dir / "test_resources_generated.py"
-        with open(resource_file, "w", encoding="utf-8") as f:
-            f.write(resource_test_code)
-        print("   ✅ test_resources_generated.py")
+        files.append((test_dir / "test_resources_generated.py", resource_test_code))
+
+    _batch_write(files)
 
 
 def write_test_runner(test_runner_code: str, output_file: Path) -> None:
@@ -563,8 +552,7 @@ def write_test_runner(test_runner_code: str, output_file: Path) -> None:
     """
     output_file.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.write(test_runner_code)
+    output_file.write_bytes(test_runner_code.encode("utf-8"))
 
     # Make executable on Unix-like systems
     import stat